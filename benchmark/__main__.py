@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import sys
-from . import bench_code_data
+from . import bench_bitpack, bench_code_data, bench_minhash
 
 
 def main():
@@ -8,11 +8,17 @@ def main():
         print("Usage: python -m benchmark <command> [args...]")
         print("\nAvailable commands:")
         print("  datacode <filepath>  - Benchmark data code generation")
+        print("  minhash              - Benchmark minhash compression")
+        print("  bitpack              - Benchmark bit packing in soft hashers")
         return
 
     command = sys.argv[1]
     if command == "datacode":
         bench_code_data.main()
+    elif command == "minhash":
+        bench_minhash.main()
+    elif command == "bitpack":
+        bench_bitpack.main()
     else:
         print(f"Unknown command: {command}")
         print("Use 'python -m benchmark' to see available commands")
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Per-call benchmarks of the soft hashers that pack bits with `iscc_core.utils.pack_bits`."""
+
+import random
+import timeit
+from statistics import median
+from bitarray import bitarray
+from more_itertools import chunked
+import iscc_core as ic
+from iscc_core.wtahash import WTA_VIDEO_ID_PERMUTATIONS
+from .bench_minhash import minhash_compress_reference
+
+
+def soft_hash_image_reference(pixels, bits=64):
+    """String based bit packing (previous implementation of `soft_hash_image_v0`)."""
+    dct_matrix = ic.alg_dct_2d(list(chunked(pixels, 32)))
+    bitstring = ""
+    for x, y in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        flat_list = [v for sublist in dct_matrix[y : y + 8] for v in sublist[x : x + 8]]
+        med = median(flat_list)
+        for value in flat_list:
+            if value > med:
+                bitstring += "1"
+            else:
+                bitstring += "0"
+        bl = len(bitstring)
+        if bl >= bits:
+            return int(bitstring, 2).to_bytes(bl // 8, "big", signed=False)
+
+
+def threshold_string(slices):
+    """String based thresholding of DCT slices against their medians (previous packing)."""
+    bitstring = ""
+    for flat_list, med in slices:
+        for value in flat_list:
+            if value > med:
+                bitstring += "1"
+            else:
+                bitstring += "0"
+    return int(bitstring, 2).to_bytes(len(bitstring) // 8, "big", signed=False)
+
+
+def threshold_packed(slices):
+    """Thresholding of DCT slices against their medians as done by `soft_hash_image_v0`."""
+    bits_list = []
+    for flat_list, med in slices:
+        bits_list.extend([value > med for value in flat_list])
+    return ic.utils.pack_bits(bits_list)
+
+
+def wtahash_reference(vec, bits):
+    """Per-bit append and `index(max())` (previous implementation of `alg_wtahash`)."""
+    h = []
+    for perm in WTA_VIDEO_ID_PERMUTATIONS:
+        v = vec[perm[0]], vec[perm[1]]
+        h.append(v.index(max(v)))
+        if len(h) == bits:
+            break
+    return bitarray(h).tobytes()
+
+
+def compare(reference, current, iterations):
+    """Time `reference` and `current` callables and return per-call timings in µs."""
+    assert reference() == current()
+    ref = timeit.timeit(reference, number=iterations)
+    new = timeit.timeit(current, number=iterations)
+    return {
+        "reference_us": ref / iterations * 1e6,
+        "current_us": new / iterations * 1e6,
+        "speedup": ref / new,
+    }
+
+
+def benchmark_bitpack(iterations=2000, seed=42):
+    """Benchmark the soft hashers against their previous bit packing implementations."""
+    random.seed(seed)
+    pixels = [random.randint(0, 255) for _ in range(1024)]
+    vec = [random.randint(0, 8) for _ in range(380)]
+    mhash = [random.getrandbits(32) for _ in range(64)]
+    dct_matrix = ic.alg_dct_2d(list(chunked(pixels, 32)))
+    slices = []
+    for x, y in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        flat_list = [v for sublist in dct_matrix[y : y + 8] for v in sublist[x : x + 8]]
+        slices.append((flat_list, median(flat_list)))
+    return {
+        "soft_hash_image_v0 bit packing (256 bits)": compare(
+            lambda: threshold_string(slices),
+            lambda: threshold_packed(slices),
+            iterations * 10,
+        ),
+        "soft_hash_image_v0 (256 bits)": compare(
+            lambda: soft_hash_image_reference(pixels, 256),
+            lambda: ic.soft_hash_image_v0(pixels, 256),
+            iterations,
+        ),
+        "alg_wtahash (256 bits)": compare(
+            lambda: wtahash_reference(vec, 256),
+            lambda: ic.alg_wtahash(vec, 256),
+            iterations * 10,
+        ),
+        "alg_minhash_compress (64 x 4 bits)": compare(
+            lambda: minhash_compress_reference(mhash),
+            lambda: ic.alg_minhash_compress(mhash),
+            iterations * 10,
+        ),
+    }
+
+
+def main():
+    results = benchmark_bitpack()
+
+    print("\nBenchmark results for bit packing in soft hashers:")
+    for name, result in results.items():
+        print(f"\n{name}")
+        print(f"Previous:       {result['reference_us']:.2f} µs/call")
+        print(f"Bit packing:    {result['current_us']:.2f} µs/call")
+        print(f"Speedup:        {result['speedup']:.2f}x")
+    print(f"\nCython extension modules used: {ic.turbo()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import random
 import platform
 import iscc_core as ic
 from iscc_core.code_content_text import gen_text_code
+from iscc_core.parallel import gen_text_codes
 
 try:
     import cpuinfo
@@ -62,6 +63,20 @@ def benchmark_gen_text_code(text_length, iterations=100):
     return pages_per_second, memory_increase
 
 
+def benchmark_gen_text_codes(text_length, documents=32, workers=None):
+    texts = [generate_text(text_length, seed=seed) for seed in range(documents)]
+
+    start_time = time.time()
+    for _ in gen_text_codes(texts, workers=workers, chunksize=4):
+        pass
+    end_time = time.time()
+
+    total_time = end_time - start_time
+    pages_per_second = (documents * text_length / 3000) / total_time
+
+    return pages_per_second
+
+
 def main():
     text_length = 3000 * 100  # 100 pages
     iterations = 3
@@ -108,6 +123,12 @@ def main():
     print(f"Max memory increase: {memory_increase:.2f} MB")
     print(f"Cython extension modules used: {ic.turbo()}")
 
+    pages_per_second = benchmark_gen_text_codes(3000 * 10)
+
+    print("\nBenchmark results for gen_text_codes (10 pages per document):")
+    print(f"Workers: {psutil.cpu_count(logical=True)}")
+    print(f"Pages per second: {pages_per_second:.2f}")
+
 
 if __name__ == "__main__":
     main()
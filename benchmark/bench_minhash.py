@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import random
+import timeit
+import iscc_core as ic
+
+
+def minhash_compress_reference(mhash, lsb=4):
+    """String based bit packing (previous implementation of `alg_minhash_compress`)."""
+    bits: str = ""
+    for bitpos in range(lsb):
+        for h in mhash:
+            bits += str(h >> bitpos & 1)
+    return int(bits, 2).to_bytes((len(bits) + 7) // 8, "big")
+
+
+def benchmark_minhash_compress(iterations=20000, seed=42):
+    """Benchmark minhash compression against the string based reference implementation."""
+    random.seed(seed)
+    mhash = [random.getrandbits(32) for _ in range(64)]
+    assert ic.alg_minhash_compress(mhash) == minhash_compress_reference(mhash)
+
+    ref = timeit.timeit(lambda: minhash_compress_reference(mhash), number=iterations)
+    new = timeit.timeit(lambda: ic.alg_minhash_compress(mhash), number=iterations)
+    return {
+        "reference_us": ref / iterations * 1e6,
+        "current_us": new / iterations * 1e6,
+        "speedup": ref / new,
+    }
+
+
+def main():
+    results = benchmark_minhash_compress()
+
+    print("\nBenchmark results for alg_minhash_compress (64 x 4 bits):")
+    print(f"String packing: {results['reference_us']:.2f} µs/call")
+    print(f"Bit packing:    {results['current_us']:.2f} µs/call")
+    print(f"Speedup:        {results['speedup']:.2f}x")
+    print(f"Cython extension modules used: {ic.turbo()}")
+
+
+if __name__ == "__main__":
+    main()
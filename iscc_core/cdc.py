@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 """Compatible with [fastcdc](https://pypi.org/project/fastcdc/)"""
-import io
 from math import log2
-from typing import Generator
+from typing import Generator, Tuple
 import iscc_core as ic
+from iscc_core.options import CoreOptions
+
+try:
+    from iscc_core.fastcdc import chunk_generator
+except ImportError:
+    chunk_generator = None
+
+#: Default gear vector (the compiled `fastcdc` extension module only supports this one)
+CDC_DEFAULT_GEAR = CoreOptions.__fields__["cdc_gear"].default
 
 __all__ = [
     "alg_cdc_chunks",
+    "alg_cdc_spans",
 ]
 
 
@@ -29,25 +38,52 @@ def alg_cdc_chunks(data, utf32, avg_chunk_size=ic.core_opts.data_avg_chunk_size)
     :rtype: Generator[bytes]
     """
 
-    stream = io.BytesIO(data)
-    buffer = stream.read(ic.core_opts.io_read_size)
-    if not buffer:
+    view = memoryview(data).cast("B")
+    if not view:
         yield b""
 
     mi, ma, cs, mask_s, mask_l = alg_cdc_params(avg_chunk_size)
 
-    buffer = memoryview(buffer)
-    while buffer:
-        if len(buffer) <= ma:
-            buffer = memoryview(bytes(buffer) + stream.read(ic.core_opts.io_read_size))
-        cut_point = alg_cdc_offset(buffer, mi, ma, cs, mask_s, mask_l)
+    while view:
+        cut_point = alg_cdc_offset(view, mi, ma, cs, mask_s, mask_l)
 
         # Make sure cut points are at 4-byte aligned for utf32 encoded text
         if utf32:
             cut_point -= cut_point % 4
 
-        yield bytes(buffer[:cut_point])
-        buffer = buffer[cut_point:]
+        yield bytes(view[:cut_point])
+        view = view[cut_point:]
+
+
+def alg_cdc_spans(data, avg_chunk_size=ic.core_opts.data_avg_chunk_size):
+    # type: (ic.Data, int) -> Generator[Tuple[int, int], None, None]
+    """
+    A generator that yields `(offset, size)` spans of data-dependent chunks for `data`.
+
+    Uses the compiled `fastcdc` extension module if available and the `cdc_gear` option has
+    its default value (the extension module has the default gear vector built in). Falls back
+    to the pure Python implementation otherwise, so both paths produce identical cut points.
+    Unlike `alg_cdc_chunks` no chunk data is copied and nothing is yielded for empty `data`.
+
+    :param Data data: Raw data for variable sized chunking.
+    :param int avg_chunk_size: Target chunk size in number of bytes.
+    :return: A generator that yields tuples of chunk offset and chunk size.
+    :rtype: Generator[Tuple[int, int]]
+    """
+    mi, ma, cs, mask_s, mask_l = alg_cdc_params(avg_chunk_size)
+    view = memoryview(data).cast("B")
+    native = chunk_generator is not None and ic.core_opts.cdc_gear == CDC_DEFAULT_GEAR
+    if native:  # pragma: no cover
+        for chunk in chunk_generator(view, mi, avg_chunk_size, ma, False, None):
+            yield chunk.offset, chunk.length
+        return
+
+    offset = 0
+    size = len(view)
+    while offset < size:
+        cut_point = alg_cdc_offset(view[offset:], mi, ma, cs, mask_s, mask_l)
+        yield offset, cut_point
+        offset += cut_point
 
 
 def alg_cdc_offset(buffer, mi, ma, cs, mask_s, mask_l):
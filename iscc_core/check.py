@@ -10,6 +10,11 @@ def turbo():  # pragma: no cover
     """Check whether all optional cython extensions have been compiled to native modules."""
     from iscc_core import cdc, minhash, simhash, dct, wtahash
 
+    try:
+        from iscc_core import fastcdc, fastngram
+    except ImportError:
+        return False
+
     modules = (cdc, minhash, simhash, dct, wtahash)
     for module in modules:
         module_file = inspect.getfile(module)
@@ -11,14 +11,22 @@ command line parameters:
 
 `$ fpcalc -raw -json -signed -length 0 myaudiofile.mp3`
 """
-from typing import Iterable
-from more_itertools import divide
+import sys
+from array import array
+from typing import Iterable, List, Tuple
+from bitarray import bitarray
 import iscc_core as ic
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 __all__ = [
     "gen_audio_code",
     "gen_audio_code_v0",
     "soft_hash_audio_v0",
+    "soft_hash_audio_segments_v0",
 ]
 
 
@@ -35,16 +43,23 @@ def gen_audio_code(cv, bits=ic.core_opts.audio_bits):
     return gen_audio_code_v0(cv, bits)
 
 
-def gen_audio_code_v0(cv, bits=ic.core_opts.audio_bits):
-    # type: (Iterable[int], int) -> dict
+def gen_audio_code_v0(cv, bits=ic.core_opts.audio_bits, granular=False):
+    # type: (Iterable[int], int, bool) -> dict
     """
     Create an ISCC Content-Code Audio with algorithm v0.
 
+    With `granular=True` the result has an additional property `features` with 64-bit
+    simprints, time offsets and durations (in seconds) of overlapping segments of the
+    Chromaprint vector (see
+    [`soft_hash_audio_segments_v0`][iscc_core.code_content_audio.soft_hash_audio_segments_v0]).
+
     :param Iterable[int] cv: Chromaprint vector
     :param int bits: Bit-length resulting Content-Code Audio (multiple of 64)
+    :param bool granular: Include simprints of audio segments for partial matching.
     :return: ISCC object with Content-Code Audio
     :rtype: dict
     """
+    cv = chromaprint_array(cv)
     digest = soft_hash_audio_v0(cv, bits=bits)
     audio_code = ic.encode_component(
         mtype=ic.MT.CONTENT,
@@ -54,7 +69,22 @@ def gen_audio_code_v0(cv, bits=ic.core_opts.audio_bits):
         digest=digest,
     )
     iscc = "ISCC:" + audio_code
-    return {"iscc": iscc}
+    result = {"iscc": iscc}
+
+    if granular:
+        segments = soft_hash_audio_segments_v0(cv)
+        result["features"] = [
+            dict(
+                maintype="content",
+                subtype="audio",
+                version=0,
+                simprints=[ic.encode_base64(simprint) for simprint in segments["simprints"]],
+                offsets=[round(o * CHROMAPRINT_FEATURE_DURATION, 3) for o in segments["offsets"]],
+                sizes=[round(s * CHROMAPRINT_FEATURE_DURATION, 3) for s in segments["sizes"]],
+            )
+        ]
+
+    return result
 
 
 def soft_hash_audio_v0(cv, bits=ic.core_opts.audio_bits):
@@ -62,46 +92,265 @@ def soft_hash_audio_v0(cv, bits=ic.core_opts.audio_bits):
     """
     Create audio similarity hash from a chromaprint vector.
 
+    The vector may also be given as `array("i")` or NumPy int32 array. All 32-bit simhash
+    segments are calculated from column bit-counts over one big-endian bit matrix of the
+    features, without creating a bytes object per feature.
+
     :param Iterable[int] cv: Chromaprint vector
     :param int bits: Bit-length resulting similarity hash (multiple of 32)
     :return: Audio-Hash digest
     :rtype: bytes
     """
 
-    # Convert chrompaprint vector into list of 4 byte digests
-    digests = [int_feature.to_bytes(4, "big", signed=True) for int_feature in cv]
+    values = chromaprint_array(cv)
 
-    # Return identity hash if we have 0 digests
-    if not digests:
+    # Return identity hash if we have 0 features
+    if not values:
         return b"\x00" * 32
 
-    # Calculate simhash of digests as first 32-bit chunk of the hash
-    parts = [ic.alg_simhash(digests)]
+    # Calculate simhash of all features as first 32-bit chunk of the hash
+    matrix = chromaprint_matrix(values)
+    parts = [simhash_rows(matrix, 0, len(values))]
 
     bit_length = 32
 
     # Calculate separate 32-bit simhashes for each quarter of features (original order)
-    for bucket in divide(4, digests):
-        features = list(bucket)
-        if features:
-            parts.append(ic.alg_simhash(features))
-        else:
-            parts.append(b"\x00\x00\x00\x00")
+    for start, stop in bucket_bounds(len(values), 4):
+        parts.append(simhash_rows(matrix, start, stop))
         bit_length += 32
         if bit_length == bits:
             return b"".join(parts)
 
     # Calculate separate simhashes for each third of features (ordered by int value)
-    cvs = sorted(cv)
-    digests = [int_feature.to_bytes(4, "big", signed=True) for int_feature in cvs]
-    for bucket in divide(3, digests):
-        features = list(bucket)
-        if features:
-            parts.append(ic.alg_simhash(features))
-        else:
-            parts.append(b"\x00\x00\x00\x00")
+    matrix = chromaprint_matrix(chromaprint_sorted(values))
+    for start, stop in bucket_bounds(len(values), 3):
+        parts.append(simhash_rows(matrix, start, stop))
         bit_length += 32
         if bit_length == bits:
             return b"".join(parts)
 
     return b"".join(parts)
+
+
+#: Duration of one Chromaprint feature in seconds (1365 samples at 11025 Hz)
+CHROMAPRINT_FEATURE_DURATION = 1365 / 11025
+
+
+def soft_hash_audio_segments_v0(
+    cv,
+    segment_size=ic.core_opts.audio_segment_size,
+    segment_step=ic.core_opts.audio_segment_step,
+):
+    # type: (Iterable[int], int, int) -> dict
+    """
+    Create 64-bit audio similarity hashes for overlapping segments of a Chromaprint vector.
+
+    A window of `segment_size` features slides over the vector in steps of `segment_step`
+    features. A final segment aligned to the end of the vector is added if the last window
+    does not reach it. Vectors shorter than `segment_size` produce a single segment. Each
+    segment is hashed like a 64-bit
+    [`soft_hash_audio_v0`][iscc_core.code_content_audio.soft_hash_audio_v0] of its features.
+
+    The column bit-counts of the segment and of its first quarter are updated incrementally,
+    so only the features entering and leaving the window are counted for each step.
+
+    :param Iterable[int] cv: Chromaprint vector
+    :param int segment_size: Number of features per segment.
+    :param int segment_step: Number of features between the starts of consecutive segments.
+    :return: Segment properties: simprints (bytes), offsets and sizes (in features)
+    :rtype: dict
+    """
+    if segment_size < 1 or segment_step < 1:
+        raise ValueError("Segment size and step must be positive")
+    values = chromaprint_array(cv)
+    n = len(values)
+    size = min(segment_size, n)
+    starts = list(range(0, n - size + 1, segment_step))
+    if starts[-1] + size < n:
+        starts.append(n - size)
+
+    matrix = chromaprint_matrix(values)
+    quarter = bucket_bounds(size, 4)[0][1]
+    window, head = ColumnCounts(matrix), ColumnCounts(matrix)
+    simprints = []
+    for start in starts:
+        window.move(start, start + size)
+        head.move(start, start + quarter)
+        simprints.append(window.simhash() + head.simhash())
+    return dict(simprints=simprints, offsets=starts, sizes=[size] * len(starts))
+
+
+def chromaprint_array(cv):
+    # type: (Iterable[int]) -> array
+    """
+    Convert a Chromaprint vector to an array of signed 32-bit integers.
+
+    Raises `OverflowError` for values that do not fit into a signed 32-bit integer.
+
+    :param Iterable[int] cv: Chromaprint vector as iterable, `array("i")` or NumPy array
+    :return: Chromaprint vector as `array("i")`
+    :rtype: array
+    """
+    if isinstance(cv, array) and cv.typecode == "i":
+        return cv
+    if np is not None and isinstance(cv, np.ndarray) and cv.dtype.kind == "i":
+        if cv.dtype.itemsize == 4:
+            values = array("i")
+            values.frombytes(np.ascontiguousarray(cv, dtype=np.intc).tobytes())
+            return values
+    return array("i", cv)
+
+
+def chromaprint_sorted(values):
+    # type: (array) -> array
+    """
+    Sort a Chromaprint vector by integer value (with NumPy if installed).
+
+    :param array values: Chromaprint vector as `array("i")`
+    :return: Sorted Chromaprint vector as `array("i")`
+    :rtype: array
+    """
+    if np is None:
+        return array("i", sorted(values))
+    result = array("i")
+    result.frombytes(np.sort(np.frombuffer(values, dtype=np.intc)).tobytes())
+    return result
+
+
+def chromaprint_matrix(values):
+    # type: (array) -> bitarray
+    """
+    Create a bit matrix with one row of 32 bits per feature of a Chromaprint vector.
+
+    Rows hold the big-endian two's complement bits of the features, so they match the
+    `int.to_bytes(4, "big", signed=True)` digests of the features.
+
+    :param array values: Chromaprint vector as `array("i")`
+    :return: Bit matrix of `32 * len(values)` bits
+    :rtype: bitarray
+    """
+    if sys.byteorder == "little":
+        values = array("i", values)
+        values.byteswap()
+    matrix = bitarray()
+    matrix.frombytes(values.tobytes())
+    return matrix
+
+
+def simhash_rows(matrix, start, stop):
+    # type: (bitarray, int, int) -> bytes
+    """
+    Calculate the 32-bit simhash of the rows `start` to `stop` of a Chromaprint bit matrix.
+
+    The result is identical to [`alg_simhash`][iscc_core.simhash.alg_simhash] of the
+    corresponding 4-byte feature digests. An empty row range produces a zero digest.
+
+    :param bitarray matrix: Bit matrix created by `chromaprint_matrix`
+    :param int start: Index of the first row
+    :param int stop: Index after the last row
+    :return: 32-bit simhash digest
+    :rtype: bytes
+    """
+    return simhash_counts(column_counts(matrix, start, stop), stop - start)
+
+
+def column_counts(matrix, start, stop):
+    # type: (bitarray, int, int) -> List[int]
+    """
+    Count the set bits per column in the rows `start` to `stop` of a Chromaprint bit matrix.
+
+    :param bitarray matrix: Bit matrix created by `chromaprint_matrix`
+    :param int start: Index of the first row
+    :param int stop: Index after the last row
+    :return: Number of set bits for each of the 32 columns
+    :rtype: List[int]
+    """
+    if stop <= start:
+        return [0] * 32
+    end = stop * 32
+    return [matrix.count(1, start * 32 + i, end, 32) for i in range(32)]
+
+
+def simhash_counts(counts, n_rows):
+    # type: (List[int], int) -> bytes
+    """
+    Create a 32-bit simhash from the column bit-counts of `n_rows` rows.
+
+    A bit is set if at least half of the rows have the bit set, like in
+    [`alg_simhash`][iscc_core.simhash.alg_simhash]. Zero rows produce a zero digest.
+
+    :param List[int] counts: Number of set bits for each of the 32 columns
+    :param int n_rows: Number of counted rows
+    :return: 32-bit simhash digest
+    :rtype: bytes
+    """
+    if n_rows <= 0:
+        return b"\x00\x00\x00\x00"
+    return ic.utils.pack_bits([2 * count >= n_rows for count in counts])
+
+
+class ColumnCounts:
+    """Column bit-counts of a range of rows of a Chromaprint bit matrix that can be moved."""
+
+    def __init__(self, matrix):
+        # type: (bitarray) -> None
+        """
+        Create column counts of an empty row range.
+
+        :param bitarray matrix: Bit matrix created by `chromaprint_matrix`
+        """
+        self.matrix = matrix
+        self.start = 0
+        self.stop = 0
+        self.counts = [0] * 32
+
+    def move(self, start, stop):
+        # type: (int, int) -> None
+        """
+        Move the counted row range to `start` to `stop`.
+
+        If the new range overlaps the current one and both bounds move forward, only the rows
+        entering and leaving the range are counted. Otherwise the range is counted from scratch.
+
+        :param int start: Index of the first row
+        :param int stop: Index after the last row
+        """
+        if self.start <= start <= self.stop <= stop:
+            added = column_counts(self.matrix, self.stop, stop)
+            removed = column_counts(self.matrix, self.start, start)
+            self.counts = [c + a - r for c, a, r in zip(self.counts, added, removed)]
+        else:
+            self.counts = column_counts(self.matrix, start, stop)
+        self.start, self.stop = start, stop
+
+    def simhash(self):
+        # type: () -> bytes
+        """
+        Create the 32-bit simhash of the counted rows.
+
+        :return: 32-bit simhash digest
+        :rtype: bytes
+        """
+        return simhash_counts(self.counts, self.stop - self.start)
+
+
+def bucket_bounds(size, n):
+    # type: (int, int) -> List[Tuple[int, int]]
+    """
+    Split `size` items into `n` consecutive buckets like `more_itertools.divide`.
+
+    The first `size % n` buckets hold one item more than the others.
+
+    :param int size: Number of items
+    :param int n: Number of buckets
+    :return: List of (start, stop) item indices per bucket
+    :rtype: List[Tuple[int, int]]
+    """
+    q, r = divmod(size, n)
+    bounds = []
+    start = 0
+    for i in range(n):
+        stop = start + q + (1 if i < r else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
@@ -15,14 +15,21 @@ Images must be normalized before using gen_image_code. Prepare images as follows
 - Flatten 32x32 matrix to an array of 1024 grayscale (uint8) pixel values
 """
 from statistics import median
-from typing import Sequence
+from typing import List, Sequence
 from more_itertools import chunked
 import iscc_core as ic
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 __all__ = [
     "gen_image_code",
     "gen_image_code_v0",
+    "gen_image_codes_batch",
     "soft_hash_image_v0",
+    "soft_hash_image_batch_v0",
 ]
 
 
@@ -74,24 +81,14 @@ def soft_hash_image_v0(pixels, bits=ic.core_opts.image_bits):
     if not bits <= 256:
         raise AssertionError(f"{bits} bits exeeds max lenght 256 for soft_hash_image")
 
-    # DCT per row
-    dct_row_lists = []
-    for pixel_list in chunked(pixels, 32):
-        dct_row_lists.append(ic.alg_dct(pixel_list))
-
-    # DCT per col
-    dct_row_lists_t = list(map(list, zip(*dct_row_lists)))
-    dct_col_lists_t = []
-    for dct_list in dct_row_lists_t:
-        dct_col_lists_t.append(ic.alg_dct(dct_list))
-
-    dct_matrix = list(map(list, zip(*dct_col_lists_t)))
+    # DCT per row and per col
+    dct_matrix = ic.alg_dct_2d(list(chunked(pixels, 32)))
 
     def flatten(m, x, y):
         """Extract and flatten an 8 x 8 slice from a 2d matrix starting at col/row."""
         return [v for sublist in m[y : y + 8] for v in sublist[x : x + 8]]
 
-    bitstring = ""
+    bits_list = []
     slices = ((0, 0), (1, 0), (0, 1), (1, 1))
 
     for xy in slices:
@@ -102,12 +99,84 @@ def soft_hash_image_v0(pixels, bits=ic.core_opts.image_bits):
         med = median(flat_list)
 
         # Append 64-bit digest by comparing to median
-        for value in flat_list:
-            if value > med:
-                bitstring += "1"
-            else:
-                bitstring += "0"
-        bl = len(bitstring)
-        if bl >= bits:
-            hash_digest = int(bitstring, 2).to_bytes(bl // 8, "big", signed=False)
-            return hash_digest
+        bits_list.extend([value > med for value in flat_list])
+        if len(bits_list) >= bits:
+            return ic.utils.pack_bits(bits_list)
+
+
+def gen_image_codes_batch(pixels, bits=ic.core_opts.image_bits):
+    # type: (Sequence[Sequence[int]]|bytes|np.ndarray, int) -> List[dict]
+    """
+    Create ISCC Content-Codes Image for a batch of images with algorithm v0.
+
+    The results are identical to calling
+    [`gen_image_code_v0`][iscc_core.code_content_image.gen_image_code_v0] for each image.
+
+    :param Sequence[Sequence[int]]|bytes|np.ndarray pixels: Normalized pixels of N images as
+        (N, 1024) array, sequence of pixel sequences or buffer of N * 1024 uint8 values.
+    :param int bits: Bit-length of ISCC Content-Code Image (default 64).
+    :return: List of ISCC objects with Content-Code Image.
+    :rtype: List[dict]
+    """
+    results = []
+    for digest in soft_hash_image_batch_v0(pixels, bits=bits):
+        image_code = ic.encode_component(
+            mtype=ic.MT.CONTENT,
+            stype=ic.ST_CC.IMAGE,
+            version=ic.VS.V0,
+            bit_length=bits,
+            digest=digest,
+        )
+        results.append({"iscc": "ISCC:" + image_code})
+    return results
+
+
+def soft_hash_image_batch_v0(pixels, bits=ic.core_opts.image_bits):
+    # type: (Sequence[Sequence[int]]|bytes|np.ndarray, int) -> List[bytes]
+    """
+    Calculate image hashes for a batch of normalized grayscale images.
+
+    If NumPy is installed the DCT, median thresholding and bit packing run on the whole batch
+    at once. The DCT uses [`alg_dct_np`][iscc_core.dct.alg_dct_np] and medians are the mean
+    of the two middle values like `statistics.median`, so the digests are bit-identical to
+    [`soft_hash_image_v0`][iscc_core.code_content_image.soft_hash_image_v0].
+
+    :param Sequence[Sequence[int]]|bytes|np.ndarray pixels: Normalized pixels of N images as
+        (N, 1024) array, sequence of pixel sequences or buffer of N * 1024 uint8 values.
+    :param int bits: Bit-length of image hash (default 64).
+    :return: List of similarity preserving Image-Hash digests.
+    :rtype: List[bytes]
+    """
+    if not bits <= 256:
+        raise AssertionError(f"{bits} bits exeeds max lenght 256 for soft_hash_image")
+    if isinstance(pixels, (bytes, bytearray, memoryview)):
+        pixels = list(chunked(bytes(pixels), 1024))
+    if np is None:  # pragma: no cover
+        return [soft_hash_image_v0(image, bits=bits) for image in pixels]
+
+    images = np.asarray(pixels, dtype=np.float64).reshape(-1, 32, 32)
+    slices = ((0, 0), (1, 0), (0, 1), (1, 1))[: -(-bits // 64)]
+    digests = []
+    # Process blocks of images to keep intermediate arrays small
+    for start in range(0, len(images), IMAGE_BATCH_BLOCK_SIZE):
+        block = images[start : start + IMAGE_BATCH_BLOCK_SIZE]
+        n = len(block)
+
+        # DCT per row and per col
+        dct_rows = ic.alg_dct_np(block.reshape(-1, 32)).reshape(n, 32, 32)
+        dct_cols = ic.alg_dct_np(dct_rows.transpose(0, 2, 1).reshape(-1, 32)).reshape(n, 32, 32)
+        dct_matrix = dct_cols.transpose(0, 2, 1)
+
+        # Compare 8 x 8 slices against their medians
+        hash_bits = []
+        for x, y in slices:
+            flat = dct_matrix[:, y : y + 8, x : x + 8].reshape(n, 64)
+            middle = np.sort(flat, axis=1)[:, 31:33]
+            med = (middle[:, 0] + middle[:, 1]) / 2
+            hash_bits.append(flat > med[:, None])
+        digests.extend(row.tobytes() for row in np.packbits(np.hstack(hash_bits), axis=1))
+    return digests
+
+
+#: Number of images processed at once by `soft_hash_image_batch_v0`
+IMAGE_BATCH_BLOCK_SIZE = 256
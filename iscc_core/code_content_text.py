@@ -19,14 +19,26 @@ from a media assets.
 """
 
 import unicodedata
+from array import array
+from itertools import compress
+from typing import Callable, Optional
 import xxhash
 import iscc_core as ic
 
+try:
+    from iscc_core.fastngram import xxh32_ngrams
+except ImportError:
+    xxh32_ngrams = None
+
 __all__ = [
     "gen_text_code",
     "gen_text_code_v0",
     "soft_hash_text_v0",
+    "soft_hash_text_chunks_v0",
+    "alg_text_features",
     "text_collapse",
+    "TextHasher",
+    "TextHasherV0",
 ]
 
 
@@ -43,8 +55,8 @@ def gen_text_code(text, bits=ic.core_opts.text_bits):
     return gen_text_code_v0(text, bits)
 
 
-def gen_text_code_v0(text, bits=ic.core_opts.text_bits):
-    # type: (str, int) -> dict
+def gen_text_code_v0(text, bits=ic.core_opts.text_bits, granular=False):
+    # type: (str, int, bool) -> dict
     """
     Create an ISCC Text-Code with algorithm v0.
 
@@ -52,8 +64,13 @@ def gen_text_code_v0(text, bits=ic.core_opts.text_bits):
         Any markup (like HTML tags or markdown) should be removed from the plain-text
         before passing it to this function.
 
+    With `granular=True` the result has an additional property `features` with 64-bit
+    simprints, character offsets and sizes of content defined chunks of the collapsed text
+    (see [`soft_hash_text_chunks_v0`][iscc_core.code_content_text.soft_hash_text_chunks_v0]).
+
     :param str text: Text for Text-Code creation
     :param int bits: Bit-length of ISCC Code Hash (default 64)
+    :param bool granular: Include simprints of text chunks for partial matching.
     :return: ISCC schema instance with Text-Code and an aditional property `characters`
     :rtype: dict
     """
@@ -71,8 +88,22 @@ def gen_text_code_v0(text, bits=ic.core_opts.text_bits):
     )
 
     iscc = "ISCC:" + text_code
+    result = dict(iscc=iscc, characters=characters)
 
-    return dict(iscc=iscc, characters=characters)
+    if granular:
+        chunks = soft_hash_text_chunks_v0(text)
+        result["features"] = [
+            dict(
+                maintype="content",
+                subtype="text",
+                version=0,
+                simprints=[ic.encode_base64(simprint) for simprint in chunks["simprints"]],
+                offsets=chunks["offsets"],
+                sizes=chunks["sizes"],
+            )
+        ]
+
+    return result
 
 
 def soft_hash_text_v0(text):
@@ -99,12 +130,78 @@ def soft_hash_text_v0(text):
     :return: 256-bit similarity preserving byte hash.
     :rtype: bytes
     """
-    ngrams = ic.sliding_window(text, ic.core_opts.text_ngram_size)
-    features = [xxhash.xxh32_intdigest(s.encode("utf-8")) for s in ngrams]
+    features = alg_text_features(text, ic.core_opts.text_ngram_size)
     hash_digest = ic.alg_minhash_256(features)
     return hash_digest
 
 
+def soft_hash_text_chunks_v0(text, avg_chunk_size=ic.core_opts.text_avg_chunk_size):
+    # type: (str, int) -> dict
+    """
+    Create 64-bit similarity preserving hashes for content defined chunks of collapsed text.
+
+    The text is UTF-32 encoded and split with
+    [`alg_cdc_chunks`][iscc_core.cdc.alg_cdc_chunks] at character aligned cut points. Each
+    chunk is hashed like [`soft_hash_text_v0`][iscc_core.code_content_text.soft_hash_text_v0]
+    but with a 64-bit minhash of its n-gram features. Chunk boundaries only depend on nearby
+    content, so matching passages of different documents yield matching simprints.
+
+    !!! note
+        Text must be collapsed with
+        [`text_collapse`][iscc_core.code_content_text.text_collapse] beforehand.
+
+    :param str text: Collapsed plain text to be hashed.
+    :param int avg_chunk_size: Target chunk size in number of characters.
+    :return: Chunk properties: simprints (bytes), offsets and sizes (in characters)
+    :rtype: dict
+    """
+    ngram_size = ic.core_opts.text_ngram_size
+    simprints, offsets, sizes = [], [], []
+    offset = 0
+    for chunk in ic.alg_cdc_chunks(text.encode("utf-32-le"), True, avg_chunk_size * 4):
+        chunk_text = chunk.decode("utf-32-le")
+        simprints.append(ic.alg_minhash_64(alg_text_features(chunk_text, ngram_size)))
+        offsets.append(offset)
+        sizes.append(len(chunk_text))
+        offset += len(chunk_text)
+    return dict(simprints=simprints, offsets=offsets, sizes=sizes)
+
+
+#: Maps UTF-8 lead bytes to 1 and continuation bytes to 0 (for use with `bytes.translate`)
+UTF8_LEAD_BYTES = bytes(0 if 0x80 <= b < 0xC0 else 1 for b in range(256))
+
+
+def alg_text_features(text, ngram_size=ic.core_opts.text_ngram_size):
+    # type: (str, int) -> array
+    """
+    Create xxh32 feature hashes for all character n-grams of a text.
+
+    The text is encoded to UTF-8 only once and all n-grams are hashed in a single native pass
+    if the compiled `fastngram` extension is available. The pure Python fallback hashes byte
+    slices of the encoded text at character boundaries. The features are identical to hashing
+    the UTF-8 encoded n-grams of [`sliding_window`][iscc_core.utils.sliding_window].
+
+    :param str text: Plain text to be hashed.
+    :param int ngram_size: Number of characters per n-gram.
+    :return: Feature hashes as unsigned 32-bit integer array.
+    :rtype: array
+    """
+    if ngram_size < 2:
+        raise AssertionError("Sliding window width must be 2 or bigger.")
+    data = text.encode("utf-8")
+    if len(text) <= ngram_size:
+        return array("I", [xxhash.xxh32_intdigest(data)])
+    if xxh32_ngrams is not None:  # pragma: no cover
+        return xxh32_ngrams(data, len(text), ngram_size)
+    if len(data) == len(text):  # ASCII: character offsets are byte offsets
+        starts = range(len(data) + 1)
+    else:
+        starts = list(compress(range(len(data)), data.translate(UTF8_LEAD_BYTES)))
+        starts.append(len(data))
+    xxh32 = xxhash.xxh32_intdigest
+    return array("I", [xxh32(data[s:e]) for s, e in zip(starts, starts[ngram_size:])])
+
+
 def text_collapse(text):
     # type: (str) -> str
     """
@@ -128,11 +225,277 @@ def text_collapse(text):
     text = unicodedata.normalize("NFD", text).lower()
 
     # Remove whitespace and filter characters in one pass
-    filtered_chars = []
-
-    for ch in text:
-        if not ch.isspace() and unicodedata.category(ch)[0] not in ic.core_opts.text_unicode_filter:
-            filtered_chars.append(ch)
+    text = text.translate(collapse_table(ic.core_opts.text_unicode_filter))
 
     # Recombine
-    return unicodedata.normalize("NFKC", "".join(filtered_chars))
+    return unicodedata.normalize("NFKC", text)
+
+
+class CollapseTable(dict):
+    """
+    Lazily populated `str.translate` table that deletes characters removed by `text_collapse`.
+
+    Maps code points of whitespace characters and characters of filtered Unicode categories to
+    `None` and all other code points to themselves. Entries are computed on first lookup, so
+    repeated characters are filtered at C speed by `str.translate`.
+    """
+
+    def __init__(self, unicode_filter):
+        # type: (frozenset) -> None
+        """
+        Create a CollapseTable
+
+        :param frozenset unicode_filter: Unicode major categories to be removed.
+        """
+        super().__init__()
+        self.unicode_filter = unicode_filter
+
+    def __missing__(self, code_point):
+        # type: (int) -> int|None
+        """Compute, cache and return the translation of an unseen code point."""
+        ch = chr(code_point)
+        if ch.isspace() or unicodedata.category(ch)[0] in self.unicode_filter:
+            value = None
+        else:
+            value = code_point
+        self[code_point] = value
+        return value
+
+
+_COLLAPSE_TABLES = {}
+
+
+def collapse_table(unicode_filter):
+    # type: (frozenset) -> CollapseTable
+    """
+    Return the cached translation table for a set of filtered Unicode categories.
+
+    :param frozenset unicode_filter: Unicode major categories to be removed.
+    :return: Translation table for `str.translate`
+    :rtype: CollapseTable
+    """
+    table = _COLLAPSE_TABLES.get(unicode_filter)
+    if table is None:
+        table = _COLLAPSE_TABLES[unicode_filter] = CollapseTable(unicode_filter)
+    return table
+
+
+class TextHasherV0:
+    """
+    Incremental Text-Hash generator for very large texts.
+
+    Text can be pushed in fragments of any size. The result is identical to
+    [`gen_text_code_v0`][iscc_core.code_content_text.gen_text_code_v0] for the concatenated
+    text.
+
+    Pushed text is only collapsed up to the last safe boundary where
+    [`text_collapse`][iscc_core.code_content_text.text_collapse] of the parts equals the
+    collapsed whole. Decomposition and lower casing are split before a starter character
+    that is neither cased nor case-ignorable (such as whitespace), so combining sequences
+    and final sigma handling never straddle a boundary. NFKC recomposition is split before a
+    stable starter that does not compose with preceding characters. The last
+    `text_ngram_size - 1` collapsed characters are carried over to the next push and
+    features are folded into a running minhash vector, so memory usage only depends on the
+    distance between boundaries.
+    """
+
+    def __init__(self, text=None):
+        # type: (Optional[str]) -> None
+        """
+        Create a TextHasher
+
+        :param Optional[str] text: initial text for hashing.
+        """
+        self.raw = ""
+        self.filtered = ""
+        self.carry = ""
+        self.characters = 0
+        self.emitted = False
+        self.pending = array("I")
+        self.mhash = None
+        self.finalized = False
+        if text:
+            self.push(text)
+
+    def push(self, text):
+        # type: (str) -> None
+        """
+        Push a text fragment to the Text-Hash generator.
+
+        :param str text: Plain text fragment to be hashed
+        """
+        start = len(self.raw)
+        text = self.raw + text
+        cut = rfind_boundary(text, raw_boundaries, start)
+        self.raw = text[cut:]
+        if cut:
+            self._push_raw(text[:cut])
+
+    def digest(self):
+        # type: () -> bytes
+        """Calculate 256-bit minhash digest from feature hashes."""
+        self._finalize()
+        return ic.alg_minhash_compress(self.mhash, 4)
+
+    def code(self, bits=ic.core_opts.text_bits):
+        # type: (int) -> str
+        """
+        Encode digest as an ISCC Text-Code unit.
+
+        :param int bits: Number of bits for the ISCC Text-Code
+        :return: ISCC Text-Code
+        :rtype: str
+        """
+        text_code = ic.encode_component(
+            mtype=ic.MT.CONTENT,
+            stype=ic.ST_CC.TEXT,
+            version=ic.VS.V0,
+            bit_length=bits,
+            digest=self.digest(),
+        )
+        return text_code
+
+    def _push_raw(self, text, final=False):
+        # type: (str, bool) -> None
+        """Decompose, lowercase and filter raw text and recompose up to the last boundary."""
+        start = len(self.filtered)
+        text = unicodedata.normalize("NFD", text).lower()
+        text = self.filtered + text.translate(collapse_table(ic.core_opts.text_unicode_filter))
+        cut = len(text) if final else rfind_boundary(text, nfkc_boundaries, start)
+        self.filtered = text[cut:]
+        if cut:
+            self._push_collapsed(unicodedata.normalize("NFKC", text[:cut]))
+
+    def _push_collapsed(self, text):
+        # type: (str) -> None
+        """Create features for all complete n-grams of collapsed text."""
+        ngram_size = ic.core_opts.text_ngram_size
+        self.characters += len(text)
+        text = self.carry + text
+        if len(text) < ngram_size:
+            self.carry = text
+            return
+        self.pending.extend(alg_text_features(text, ngram_size))
+        self.emitted = True
+        self.carry = text[len(text) - ngram_size + 1 :]
+        if len(self.pending) >= ic.MINHASH_BLOCK_SIZE:
+            self._fold()
+
+    def _fold(self):
+        # type: () -> None
+        """Fold pending features into the running minhash vector."""
+        if self.pending:
+            self.mhash = ic.alg_minhash_update(self.mhash, self.pending)
+            self.pending = array("I")
+
+    def _finalize(self):
+        # type: () -> None
+        """Hash remaining buffered text and fold all pending features (idempotent)."""
+        if not self.finalized:
+            self._push_raw(self.raw, final=True)
+            self.raw = ""
+            if not self.emitted:  # Text shorter than n-gram size yields a single feature
+                self.pending.extend(alg_text_features(self.carry, ic.core_opts.text_ngram_size))
+            self.finalized = True
+        self._fold()
+
+
+TextHasher = TextHasherV0
+
+
+class BoundaryTable(dict):
+    """Lazily populated mapping of code points to whether a safe text boundary precedes them."""
+
+    def __init__(self, predicate):
+        # type: (Callable[[str], bool]) -> None
+        """
+        Create a BoundaryTable
+
+        :param Callable[[str], bool] predicate: Function that checks a single character.
+        """
+        super().__init__()
+        self.predicate = predicate
+
+    def __missing__(self, code_point):
+        # type: (int) -> bool
+        """Compute, cache and return the boundary flag of an unseen code point."""
+        value = self[code_point] = self.predicate(chr(code_point))
+        return value
+
+
+def is_raw_boundary(ch):
+    # type: (str) -> bool
+    """
+    Check if raw text can be decomposed and lowercased in parts split before `ch`.
+
+    The decomposition of `ch` must start with a starter (no canonical reordering across the
+    boundary) that is neither cased nor case-ignorable (no final sigma context across the
+    boundary). The context rules of `str.lower` are used to detect the latter.
+
+    :param str ch: Character following the boundary.
+    :return: Whether splitting before `ch` is safe.
+    :rtype: bool
+    """
+    first = unicodedata.normalize("NFD", ch)[0]
+    return unicodedata.combining(first) == 0 and ("a\u03a3" + first + "b").lower()[1] == "\u03c2"
+
+
+def is_nfkc_boundary(ch):
+    # type: (str) -> bool
+    """
+    Check if filtered text can be NFKC normalized in parts split before `ch`.
+
+    The decomposition of `ch` must start with a starter (blocks composition of following
+    characters with preceding ones) that does not compose with a preceding character itself.
+
+    :param str ch: Character following the boundary.
+    :return: Whether splitting before `ch` is safe.
+    :rtype: bool
+    """
+    first = unicodedata.normalize("NFKD", ch)[0]
+    return unicodedata.combining(first) == 0 and first not in composition_seconds()
+
+
+_COMPOSITION_SECONDS = set()
+
+
+def composition_seconds():
+    # type: () -> set
+    """
+    Return all characters that may canonically compose with a preceding character.
+
+    :return: Second characters of canonical decomposition pairs and Hangul vowel/trailing jamo.
+    :rtype: set
+    """
+    if not _COMPOSITION_SECONDS:
+        for code_point in range(0x110000):
+            decomposition = unicodedata.decomposition(chr(code_point)).split()
+            if len(decomposition) == 2 and not decomposition[0].startswith("<"):
+                _COMPOSITION_SECONDS.add(chr(int(decomposition[1], 16)))
+        _COMPOSITION_SECONDS.update(map(chr, range(0x1161, 0x1176)))
+        _COMPOSITION_SECONDS.update(map(chr, range(0x11A8, 0x11C3)))
+    return _COMPOSITION_SECONDS
+
+
+raw_boundaries = BoundaryTable(is_raw_boundary)
+nfkc_boundaries = BoundaryTable(is_nfkc_boundary)
+
+
+def rfind_boundary(text, boundaries, start=0):
+    # type: (str, BoundaryTable, int) -> int
+    """
+    Find the last safe boundary in text.
+
+    Only characters from index `start` on are checked. Callers pass the length of a carried
+    prefix that is already known to hold no boundary, so each character is scanned only once.
+
+    :param str text: Text to be searched.
+    :param BoundaryTable boundaries: Boundary table to be used.
+    :param int start: Index of the first character to be checked.
+    :return: Index of the character following the last boundary (0 if there is none).
+    :rtype: int
+    """
+    for idx in range(len(text) - 1, max(start, 1) - 1, -1):
+        if boundaries[ord(text[idx])]:
+            return idx
+    return 0
@@ -1,17 +1,30 @@
 # -*- coding: utf-8 -*-
 """*A similarity perserving hash for binary data (soft hash).*"""
-from typing import Optional
+import struct
+import sys
+from array import array
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Iterator, Optional
 import xxhash
+from blake3 import blake3
 import iscc_core as ic
+from iscc_core.utils import AsyncPushMixin
 
 __all__ = [
     "gen_data_code",
     "gen_data_code_v0",
+    "gen_data_code_file",
+    "agen_data_code",
     "soft_hash_data_v0",
     "DataHasher",
     "DataHasherV0",
 ]
 
+#: Header of serialized DataHasherV0 state (magic, flags, avg_chunk_size, tail size)
+SNAPSHOT_HEADER = struct.Struct("<4sBII")
+SNAPSHOT_MAGIC = b"DHv0"
+
 
 def gen_data_code(stream, bits=ic.core_opts.data_bits):
     # type: (ic.Stream, int) -> dict
@@ -49,6 +62,46 @@ def gen_data_code_v0(stream, bits=ic.core_opts.data_bits):
     return dict(iscc=iscc)
 
 
+def gen_data_code_file(path, bits=ic.core_opts.data_bits):
+    # type: (str|Path, int) -> dict
+    """
+    Create an ISCC Data-Code for a file with the latest standard algorithm.
+
+    The file is memory-mapped and fed to the hasher as zero-copy memoryview slices.
+
+    :param str|Path path: Path to the file.
+    :param int bits: Bit-length of ISCC Data-Code (default 64).
+    :return: ISCC object with Data-Code
+    :rtype: dict
+    """
+    hasher = DataHasherV0()
+    for view in ic.mmap_views(path):
+        hasher.push(view)
+
+    data_code = hasher.code(bits=bits)
+    iscc = "ISCC:" + data_code
+    return dict(iscc=iscc)
+
+
+async def agen_data_code(source, bits=ic.core_opts.data_bits, executor=None):
+    # type: (ic.AsyncStream, int, Executor|None) -> dict
+    """
+    Create an ISCC Data-Code from an asynchronous data source without blocking the event loop.
+
+    :param AsyncStream source: Async iterable of bytes or `asyncio.StreamReader`.
+    :param int bits: Bit-length of ISCC Data-Code (default 64).
+    :param Executor|None executor: Executor for hashing (default: the loop's default executor).
+    :return: ISCC object with Data-Code
+    :rtype: dict
+    """
+    hasher = DataHasherV0()
+    await hasher.apush_source(source, executor=executor)
+
+    data_code = hasher.code(bits=bits)
+    iscc = "ISCC:" + data_code
+    return dict(iscc=iscc)
+
+
 def soft_hash_data_v0(stream):
     # type: (ic.Stream) -> bytes
     """
@@ -67,42 +120,191 @@ def soft_hash_data_v0(stream):
     return hasher.digest()
 
 
-class DataHasherV0:
-    """Incremental Data-Hash generator."""
+class DataHasherV0(AsyncPushMixin):
+    """
+    Incremental Data-Hash generator.
+
+    Chunk features are folded into a running 64-slot minhash vector in batches, so memory
+    usage is constant regardless of the size of the hashed data.
+
+    With `granular=True` the hasher also records a chunk map (offsets, sizes and feature
+    hashes of all chunks) in compact arrays for use in deduplication or partial-match indexes.
+    """
 
-    def __init__(self, data=None):
-        # type: (Optional[ic.Data]) -> None
+    def __init__(self, data=None, granular=False, strong=False):
+        # type: (Optional[ic.Data], bool, bool) -> None
         """
         Create a DataHasher
 
         :param Optional[Data] data: initial payload for hashing.
+        :param bool granular: Keep offsets, sizes and feature hashes of all chunks in
+            `chunk_offsets`, `chunk_sizes` and `chunk_features` (memory grows linearly with
+            data size).
+        :param bool strong: Also keep a 256-bit blake3 hash per chunk in `chunk_hashes`
+            (implies `granular`).
         """
-        self.chunk_features = []
-        self.chunk_sizes = []
+        self.granular = granular or strong
+        self.strong = strong
+        self.chunk_offsets = array("Q")
+        self.chunk_sizes = array("I")
+        self.chunk_features = array("I")
+        self.chunk_hashes = bytearray()
+        self.offset = 0
+        self.pending = []
+        self.mhash = None
         self.tail = None
         data = data or b""
         self.push(data)
 
     def push(self, data):
+        # type: (ic.Data) -> None
+        """
+        Push data to the Data-Hash generator.
+
+        Chunks are hashed directly from the pushed buffer. Only the last (possibly incomplete)
+        chunk is copied and retained as tail until more data arrives, so allocations per push
+        are bounded by the maximum chunk size.
+
+        :param Data data: Data to be hashed
+        """
+        view = memoryview(data).cast("B")
+        avg_chunk_size = ic.core_opts.data_avg_chunk_size
         if self.tail:
-            data = self.tail + data
-        chunks = ic.alg_cdc_chunks(
-            data, utf32=False, avg_chunk_size=ic.core_opts.data_avg_chunk_size
-        )
-        prev_chunk = None
-        for chunk in chunks:
-            if prev_chunk is not None:  # Process only if we’ve seen a prior chunk
-                self.chunk_sizes.append(len(prev_chunk))
-                self.chunk_features.append(xxhash.xxh32_intdigest(prev_chunk))
-            prev_chunk = chunk
+            # Re-chunk the tail together with at most one max-size chunk of new data
+            max_chunk_size = ic.cdc.alg_cdc_params(avg_chunk_size)[1]
+            head = self.tail + view[:max_chunk_size]
+            _, size = next(ic.alg_cdc_spans(head, avg_chunk_size=avg_chunk_size))
+            consumed = size - len(self.tail)
+            if consumed == len(view):
+                self.tail = head
+                return
+            self._add_chunk(memoryview(head)[:size])
+            view = view[consumed:]
+
+        prev_span = None
+        for span in ic.alg_cdc_spans(view, avg_chunk_size=avg_chunk_size):
+            if prev_span is not None:  # Process only if we’ve seen a prior chunk
+                offset, size = prev_span
+                self._add_chunk(view[offset : offset + size])
+            prev_span = span
         # Handle the case where no chunks were yielded (empty input)
-        self.tail = prev_chunk if prev_chunk is not None else b""
+        self.tail = bytes(view[prev_span[0] :]) if prev_span is not None else b""
 
     def digest(self):
         # type: () -> bytes
         """Calculate 256-bit minhash digest from feature hashes."""
         self._finalize()
-        return ic.alg_minhash_256(self.chunk_features)
+        return ic.alg_minhash_compress(self.mhash, 4)
+
+    def chunks(self):
+        # type: () -> dict
+        """
+        Return the chunk map of the hashed data (requires `granular=True`).
+
+        Finalizes the hasher like `digest`. Offsets are returned as unsigned 64-bit, sizes and
+        feature hashes as unsigned 32-bit integer arrays (copies of the internal state). With
+        `strong=True` the result also includes the concatenated 32-byte blake3 hashes of all
+        chunks.
+
+        :return: Chunk map with properties: offsets, sizes, features, hashes (optional)
+        :rtype: dict
+        """
+        if not self.granular:
+            raise ValueError("Chunk map requires a DataHasher created with granular=True")
+        self._finalize()
+        result = dict(
+            offsets=self.chunk_offsets[:],
+            sizes=self.chunk_sizes[:],
+            features=self.chunk_features[:],
+        )
+        if self.strong:
+            result["hashes"] = bytes(self.chunk_hashes)
+        return result
+
+    def iter_chunks(self):
+        # type: () -> Iterator[tuple]
+        """
+        Iterate over the chunk map of the hashed data (requires `granular=True`).
+
+        :return: Generator of (offset, size, feature) tuples extended by the 32-byte blake3
+            hash of the chunk with `strong=True`.
+        :rtype: Iterator[tuple]
+        """
+        chunks = self.chunks()
+        hashes = chunks.get("hashes")
+        for idx, chunk in enumerate(zip(chunks["offsets"], chunks["sizes"], chunks["features"])):
+            if hashes is None:
+                yield chunk
+            else:
+                yield chunk + (hashes[idx * 32 : idx * 32 + 32],)
+
+    def snapshot(self):
+        # type: () -> bytes
+        """
+        Serialize the hasher state into a compact binary blob.
+
+        The blob holds the pending tail chunk, the running minhash vector and (if granular) the
+        chunk map. Hashing can be resumed from the blob with `restore` in another process
+        without re-reading earlier data. The hasher itself is not modified.
+
+        :return: Serialized hasher state
+        :rtype: bytes
+        """
+        mhash = self.mhash
+        if self.pending:
+            mhash = ic.alg_minhash_update(mhash, self.pending)
+        tail = self.tail if self.tail is not None else b""
+        flags = self.granular | self.strong << 1 | (mhash is not None) << 2
+        flags |= (self.tail is None) << 3
+        avg_chunk_size = ic.core_opts.data_avg_chunk_size
+        blob = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, flags, avg_chunk_size, len(tail)), tail]
+        if mhash is not None:
+            blob.append(_pack_array(array("I", mhash)))
+        if self.granular:
+            blob.append(struct.pack("<QI", self.offset, len(self.chunk_sizes)))
+            blob.append(_pack_array(self.chunk_offsets))
+            blob.append(_pack_array(self.chunk_sizes))
+            blob.append(_pack_array(self.chunk_features))
+            blob.append(self.chunk_hashes)
+        return b"".join(blob)
+
+    @classmethod
+    def restore(cls, blob):
+        # type: (bytes) -> DataHasherV0
+        """
+        Create a hasher from a blob created with `snapshot`.
+
+        :param bytes blob: Serialized hasher state
+        :return: Hasher ready to continue hashing
+        :rtype: DataHasherV0
+        """
+        magic, flags, avg_chunk_size, tail_size = SNAPSHOT_HEADER.unpack_from(blob)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Invalid DataHasher snapshot")
+        if avg_chunk_size != ic.core_opts.data_avg_chunk_size:
+            raise ValueError(
+                f"Snapshot avg_chunk_size {avg_chunk_size} does not match "
+                f"data_avg_chunk_size {ic.core_opts.data_avg_chunk_size}"
+            )
+        hasher = cls(granular=bool(flags & 1), strong=bool(flags & 2))
+        pos = SNAPSHOT_HEADER.size
+        hasher.tail = None if flags & 8 else bytes(blob[pos : pos + tail_size])
+        pos += tail_size
+        if flags & 4:
+            mhash, pos = _unpack_array("I", blob, pos, 64)
+            hasher.mhash = mhash.tolist()
+        if hasher.granular:
+            hasher.offset, count = struct.unpack_from("<QI", blob, pos)
+            pos += 12
+            hasher.chunk_offsets, pos = _unpack_array("Q", blob, pos, count)
+            hasher.chunk_sizes, pos = _unpack_array("I", blob, pos, count)
+            hasher.chunk_features, pos = _unpack_array("I", blob, pos, count)
+            if hasher.strong:
+                hasher.chunk_hashes = bytearray(blob[pos : pos + 32 * count])
+                pos += 32 * count
+        if pos != len(blob):
+            raise ValueError("Invalid DataHasher snapshot")
+        return hasher
 
     def code(self, bits=ic.core_opts.data_bits):
         # type: (int) -> str
@@ -122,15 +324,56 @@ class DataHasherV0:
         )
         return data_code
 
+    def _add_chunk(self, chunk):
+        # type: (ic.Data) -> None
+        """Record feature hash (and chunk map entry if granular) of a completed chunk."""
+        feature = xxhash.xxh32_intdigest(chunk)
+        self.pending.append(feature)
+        if self.granular:
+            self.chunk_offsets.append(self.offset)
+            self.chunk_sizes.append(len(chunk))
+            self.chunk_features.append(feature)
+            if self.strong:
+                self.chunk_hashes += blake3(chunk).digest()
+            self.offset += len(chunk)
+        if len(self.pending) >= ic.MINHASH_BLOCK_SIZE:
+            self._fold()
+
+    def _fold(self):
+        # type: () -> None
+        """Fold pending features into the running minhash vector."""
+        if self.pending:
+            self.mhash = ic.alg_minhash_update(self.mhash, self.pending)
+            self.pending = []
+
     def _finalize(self):
         if self.tail is not None:
             if self.tail:  # Append non-empty tail
-                self.chunk_features.append(xxhash.xxh32_intdigest(self.tail))
-                self.chunk_sizes.append(len(self.tail))
-            elif not self.chunk_features:  # Empty input case: ensure at least one feature
-                self.chunk_features.append(xxhash.xxh32_intdigest(b""))
-                self.chunk_sizes.append(0)
+                self._add_chunk(self.tail)
+            elif self.mhash is None and not self.pending:  # Empty input: ensure one feature
+                self._add_chunk(b"")
             self.tail = None
+        self._fold()
+
+
+def _pack_array(values):
+    # type: (array) -> bytes
+    """Serialize an integer array in little-endian byte order."""
+    if sys.byteorder == "big":  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode, blob, pos, count):
+    # type: (str, bytes, int, int) -> tuple
+    """Deserialize `count` little-endian integers from `blob` at `pos` (returns array, end)."""
+    values = array(typecode)
+    end = pos + values.itemsize * count
+    values.frombytes(blob[pos:end])
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values, end
 
 
 DataHasher = DataHasherV0
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""*Single-pass generation of Data-Code and Instance-Code.*
+
+Reads the input only once and feeds every buffer to both the Data-Hash and the Instance-Hash
+generator. The resulting ISCC-UNITs are identical to those of
+[`gen_data_code_v0`][iscc_core.code_data.gen_data_code_v0] and
+[`gen_instance_code_v0`][iscc_core.code_instance.gen_instance_code_v0].
+"""
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import List, Optional
+import iscc_core as ic
+from iscc_core.utils import AsyncPushMixin
+
+__all__ = [
+    "gen_data_instance_codes",
+    "gen_data_instance_codes_file",
+    "agen_data_instance_codes",
+    "DataInstanceHasher",
+    "DataInstanceHasherV0",
+]
+
+
+def gen_data_instance_codes(stream, bits=ic.core_opts.data_bits):
+    # type: (ic.Stream, int) -> dict
+    """
+    Create an ISCC Data-Code and an ISCC Instance-Code in a single pass over `stream`.
+
+    :param Stream stream: Input data stream.
+    :param int bits: Bit-length of the ISCC Data-Code and Instance-Code (default 64).
+    :return: ISCC object with properties: units, datahash, filesize
+    :rtype: dict
+    """
+    hasher = DataInstanceHasherV0()
+    data = stream.read(ic.core_opts.io_read_size)
+    while data:
+        hasher.push(data)
+        data = stream.read(ic.core_opts.io_read_size)
+    return hasher.result(bits=bits)
+
+
+def gen_data_instance_codes_file(path, bits=ic.core_opts.data_bits):
+    # type: (str|Path, int) -> dict
+    """
+    Create an ISCC Data-Code and an ISCC Instance-Code in a single pass over a memory-mapped file.
+
+    :param str|Path path: Path to the file.
+    :param int bits: Bit-length of the ISCC Data-Code and Instance-Code (default 64).
+    :return: ISCC object with properties: units, datahash, filesize
+    :rtype: dict
+    """
+    hasher = DataInstanceHasherV0()
+    for view in ic.mmap_views(path):
+        hasher.push(view)
+    return hasher.result(bits=bits)
+
+
+async def agen_data_instance_codes(source, bits=ic.core_opts.data_bits, executor=None):
+    # type: (ic.AsyncStream, int, Executor|None) -> dict
+    """
+    Create an ISCC Data-Code and an ISCC Instance-Code from an asynchronous data source.
+
+    :param AsyncStream source: Async iterable of bytes or `asyncio.StreamReader`.
+    :param int bits: Bit-length of the ISCC Data-Code and Instance-Code (default 64).
+    :param Executor|None executor: Executor for hashing (default: the loop's default executor).
+    :return: ISCC object with properties: units, datahash, filesize
+    :rtype: dict
+    """
+    hasher = DataInstanceHasherV0()
+    await hasher.apush_source(source, executor=executor)
+    return hasher.result(bits=bits)
+
+
+class DataInstanceHasherV0(AsyncPushMixin):
+    """Incremental combined Data-Hash and Instance-Hash generator."""
+
+    def __init__(self, data=None):
+        # type: (Optional[ic.Data]) -> None
+        """
+        Create a DataInstanceHasher
+
+        :param Optional[Data] data: initial payload for hashing.
+        """
+        self.data_hasher = ic.DataHasherV0()
+        self.instance_hasher = ic.InstanceHasherV0()
+        data = data or b""
+        self.push(data)
+
+    def push(self, data):
+        # type: (ic.Data) -> None
+        """
+        Push data to both the Data-Hash and the Instance-Hash generator.
+
+        :param Data data: Data to be hashed
+        """
+        self.data_hasher.push(data)
+        self.instance_hasher.push(data)
+
+    def units(self, bits=ic.core_opts.data_bits):
+        # type: (int) -> List[str]
+        """
+        Encode digests as ISCC Data-Code and ISCC Instance-Code units.
+
+        :param int bits: Number of bits for the ISCC-UNITs
+        :return: List with ISCC Data-Code and ISCC Instance-Code
+        :rtype: List[str]
+        """
+        return [
+            "ISCC:" + self.data_hasher.code(bits=bits),
+            "ISCC:" + self.instance_hasher.code(bits=bits),
+        ]
+
+    def result(self, bits=ic.core_opts.data_bits):
+        # type: (int) -> dict
+        """
+        Create ISCC object with both units and the Instance-Code properties.
+
+        :param int bits: Number of bits for the ISCC-UNITs
+        :return: ISCC object with properties: units, datahash, filesize
+        :rtype: dict
+        """
+        return dict(
+            units=self.units(bits=bits),
+            datahash=self.instance_hasher.multihash(),
+            filesize=self.instance_hasher.filesize,
+        )
+
+
+DataInstanceHasher = DataInstanceHasherV0
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 """*A data checksum.*"""
+from concurrent.futures import Executor
+from pathlib import Path
 from blake3 import blake3
 from typing import Optional
 import iscc_core as ic
+from iscc_core.utils import AsyncPushMixin
 
 __all__ = [
     "gen_instance_code",
     "gen_instance_code_v0",
+    "gen_instance_code_file",
+    "agen_instance_code",
     "hash_instance_v0",
     "InstanceHasher",
     "InstanceHasherV0",
@@ -53,6 +58,58 @@ def gen_instance_code_v0(stream, bits=ic.core_opts.instance_bits):
     return instance_code_obj
 
 
+def gen_instance_code_file(path, bits=ic.core_opts.instance_bits):
+    # type: (str|Path, int) -> dict
+    """
+    Create an ISCC Instance-Code for a file with the latest standard algorithm.
+
+    The file is memory-mapped and fed to the hasher as zero-copy memoryview slices.
+
+    :param str|Path path: Path to the file.
+    :param int bits: Bit-length of resulting Instance-Code (multiple of 64)
+    :return: ISCC object with Instance-Code and properties: datahash, filesize
+    :rtype: dict
+    """
+    hasher = InstanceHasherV0()
+    for view in ic.mmap_views(path):
+        hasher.push(view)
+
+    instance_code = hasher.code(bits=bits)
+    iscc = "ISCC:" + instance_code
+    instance_code_obj = dict(
+        iscc=iscc,
+        datahash=hasher.multihash(),
+        filesize=hasher.filesize,
+    )
+
+    return instance_code_obj
+
+
+async def agen_instance_code(source, bits=ic.core_opts.instance_bits, executor=None):
+    # type: (ic.AsyncStream, int, Executor|None) -> dict
+    """
+    Create an ISCC Instance-Code from an asynchronous data source without blocking the event loop.
+
+    :param AsyncStream source: Async iterable of bytes or `asyncio.StreamReader`.
+    :param int bits: Bit-length of resulting Instance-Code (multiple of 64)
+    :param Executor|None executor: Executor for hashing (default: the loop's default executor).
+    :return: ISCC object with Instance-Code and properties: datahash, filesize
+    :rtype: dict
+    """
+    hasher = InstanceHasherV0()
+    await hasher.apush_source(source, executor=executor)
+
+    instance_code = hasher.code(bits=bits)
+    iscc = "ISCC:" + instance_code
+    instance_code_obj = dict(
+        iscc=iscc,
+        datahash=hasher.multihash(),
+        filesize=hasher.filesize,
+    )
+
+    return instance_code_obj
+
+
 def hash_instance_v0(stream):
     # type: (ic.Stream) -> bytes
     """
@@ -70,7 +127,7 @@ def hash_instance_v0(stream):
     return hasher.digest()
 
 
-class InstanceHasherV0:
+class InstanceHasherV0(AsyncPushMixin):
     """Incremental Instance-Hash generator."""
 
     #: Multihash prefix
@@ -10,6 +10,7 @@ from typing import Tuple, Union
 
 Data = Union[bytes, bytearray, memoryview]
 Stream = Union["BinaryIO", "mmap.mmap", "BytesIO", "BufferedReader"]
+AsyncStream = Union["AsyncIterable[bytes]", "asyncio.StreamReader"]
 MainType = Union[int, "MT"]
 SubType = Union[int, "ST", "ST_CC", "ST_ISCC", "ST_ID"]
 Version = Union[int, "VS"]
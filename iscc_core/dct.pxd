@@ -0,0 +1,13 @@
+import cython
+
+
+@cython.locals(n=Py_ssize_t)
+cpdef list alg_dct(v)
+
+
+@cython.locals(i=Py_ssize_t, half=Py_ssize_t, x=double, y=double)
+cdef void dct_kernel(double[:] vector, double[:] temp, Py_ssize_t off, Py_ssize_t n, double[:] table, Py_ssize_t toff)
+
+
+@cython.locals(size=Py_ssize_t, i=Py_ssize_t)
+cpdef dct_table(Py_ssize_t n)
@@ -1,7 +1,20 @@
 # -*- coding: utf-8 -*-
+# cython: boundscheck=False, wraparound=False
 import math
+from array import array
 from typing import List, Sequence
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = [
+    "alg_dct",
+    "alg_dct_np",
+    "alg_dct_2d",
+]
+
 
 def alg_dct(v):
     # type: (Sequence[float]) -> List
@@ -18,20 +31,117 @@ def alg_dct(v):
     n = len(v)
     if n == 1:
         return list(v)
+    elif n == 0 or n & (n - 1):
+        raise ValueError()
+    vector = array("d", v)
+    temp = array("d", vector)
+    dct_kernel(vector, temp, 0, n, dct_table(n), 0)
+    return vector.tolist()
+
+
+def dct_kernel(vector, temp, off, n, table, toff):
+    # type: (array, array, int, int, array, int) -> None
+    """
+    In-place DCT of `vector[off:off + n]` using `temp` as scratch buffer of the same size.
+
+    Performs the same floating point operations as the recursive list based DCT, with the
+    beta denominators for length `n` read from `table[toff:toff + n // 2]`.
+    """
+    if n == 1:
+        return
+    half = n // 2
+    for i in range(half):
+        x = vector[off + i]
+        y = vector[off + n - 1 - i]
+        temp[off + i] = x + y
+        temp[off + half + i] = (x - y) / table[toff + i]
+    dct_kernel(temp, vector, off, half, table, toff + half)
+    dct_kernel(temp, vector, off + half, half, table, toff + half)
+    for i in range(half - 1):
+        vector[off + 2 * i] = temp[off + i]
+        vector[off + 2 * i + 1] = temp[off + half + i] + temp[off + half + i + 1]
+    vector[off + n - 2] = temp[off + half - 1]
+    vector[off + n - 1] = temp[off + n - 1]
+
+
+def alg_dct_2d(matrix):
+    # type: (Sequence[Sequence[float]]) -> List[List[float]]
+    """
+    Two-dimensional discrete cosine transform (DCT per row followed by DCT per column).
+
+    Uses the vectorized [`alg_dct_np`][iscc_core.dct.alg_dct_np] if NumPy is installed.
+
+    :param Sequence[Sequence[float]] matrix: Input matrix as sequence of rows.
+    :return: DCT transformed matrix as list of rows.
+    :rtype: List[List[float]]
+    """
+    if np is not None and len({len(row) for row in matrix}) == 1:
+        rows = alg_dct_np(np.array(matrix, dtype=np.float64))
+        return alg_dct_np(rows.T).T.tolist()
+
+    # DCT per row
+    dct_rows = [alg_dct(row) for row in matrix]
+
+    # DCT per col
+    dct_cols = [alg_dct(col) for col in map(list, zip(*dct_rows))]
+    return list(map(list, zip(*dct_cols)))
+
+
+def alg_dct_np(m):
+    # type: (np.ndarray) -> np.ndarray
+    """
+    Discrete cosine transform of all rows of a 2D array with NumPy.
+
+    Performs the same floating point operations in the same order as
+    [`alg_dct`][iscc_core.dct.alg_dct] on all rows at once, so results are bit-identical.
+
+    :param np.ndarray m: 2D float64 array with rows of length `2**k`.
+    :return: Array of DCT transformed rows.
+    :rtype: np.ndarray
+    """
+    n = m.shape[1]
+    if n == 1:
+        return m
     elif n == 0 or n % 2 != 0:
         raise ValueError()
-    else:
-        half = n // 2
-        alpha = [(v[i] + v[-(i + 1)]) for i in range(half)]
-        beta = [
-            (v[i] - v[-(i + 1)]) / (math.cos((i + 0.5) * math.pi / n) * 2.0) for i in range(half)
-        ]
-        alpha = alg_dct(alpha)
-        beta = alg_dct(beta)
-        result = []
-        for i in range(half - 1):
-            result.append(alpha[i])
-            result.append(beta[i] + beta[i + 1])
-        result.append(alpha[-1])
-        result.append(beta[-1])
-        return result
+    half = n // 2
+    head, tail = m[:, :half], m[:, : half - 1 : -1]
+    alpha = alg_dct_np(head + tail)
+    beta = alg_dct_np((head - tail) / dct_denominators(n))
+    result = np.empty_like(alpha, shape=m.shape)
+    result[:, 0::2] = alpha
+    result[:, 1:-1:2] = beta[:, :-1] + beta[:, 1:]
+    result[:, -1] = beta[:, -1]
+    return result
+
+
+_DCT_TABLES = {}
+_DCT_DENOMINATORS = {}
+
+
+def dct_table(n):
+    # type: (int) -> array
+    """
+    Return cached beta denominators for all recursion levels of a DCT of length `n`.
+
+    The denominators for length `n >> k` start at offset `n - (n >> k)`.
+    """
+    table = _DCT_TABLES.get(n)
+    if table is None:
+        table = array("d")
+        size = n
+        while size > 1:
+            table.extend([(math.cos((i + 0.5) * math.pi / size) * 2.0) for i in range(size // 2)])
+            size //= 2
+        _DCT_TABLES[n] = table
+    return table
+
+
+def dct_denominators(n):
+    # type: (int) -> np.ndarray
+    """Return cached `alg_dct` beta denominators for vectors of length `n`."""
+    denominators = _DCT_DENOMINATORS.get(n)
+    if denominators is None:
+        denominators = np.array(dct_table(n)[: n // 2], dtype=np.float64)
+        _DCT_DENOMINATORS[n] = denominators
+    return denominators
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Native xxh32 hashing of all character n-grams of UTF-8 encoded text."""
+from array import array
+
+cimport cython
+from cpython cimport array as carray
+from libc.stdint cimport uint8_t, uint32_t
+from libc.stdlib cimport malloc, free
+
+cdef uint32_t PRIME32_1 = 2654435761U
+cdef uint32_t PRIME32_2 = 2246822519U
+cdef uint32_t PRIME32_3 = 3266489917U
+cdef uint32_t PRIME32_4 = 668265263U
+cdef uint32_t PRIME32_5 = 374761393U
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def xxh32_ngrams(const uint8_t[:] data, Py_ssize_t n_chars, Py_ssize_t ngram_size):
+    # type: (bytes, int, int) -> array
+    """
+    Calculate xxh32 hashes (seed 0) of all `ngram_size` character windows of UTF-8 data.
+
+    :param data: UTF-8 encoded text
+    :param n_chars: Number of characters of the text (must be larger than `ngram_size`)
+    :param ngram_size: Number of characters per n-gram
+    :return: Feature hashes as unsigned 32-bit integer array
+    """
+    cdef Py_ssize_t size = data.shape[0]
+    cdef Py_ssize_t count = n_chars - ngram_size + 1
+    cdef Py_ssize_t width = ngram_size + 1
+    cdef Py_ssize_t i, j, slot, start
+    cdef Py_ssize_t *starts
+    cdef carray.array features = carray.clone(array("I"), count, zero=False)
+    cdef uint32_t *out = features.data.as_uints
+    cdef const uint8_t *ptr
+
+    assert n_chars > ngram_size >= 2
+    if size == 0:
+        raise ValueError("Empty data")
+    ptr = &data[0]
+    # Ring buffer with the byte offsets of the last `ngram_size + 1` character starts
+    starts = <Py_ssize_t *>malloc(width * sizeof(Py_ssize_t))
+    if starts == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            j = 0
+            slot = 0  # Ring slot of character j
+            for i in range(size):
+                if (ptr[i] & 0xC0) != 0x80:
+                    if j <= n_chars:
+                        if j >= ngram_size:
+                            # Character j ends the n-gram starting at character j - ngram_size
+                            start = starts[slot + 1 if slot + 1 < width else 0]
+                            out[j - ngram_size] = xxh32(ptr + start, i - start)
+                        starts[slot] = i
+                    slot = slot + 1 if slot + 1 < width else 0
+                    j += 1
+            if j == n_chars:
+                start = starts[slot + 1 if slot + 1 < width else 0]
+                out[count - 1] = xxh32(ptr + start, size - start)
+        if j != n_chars:
+            raise ValueError("Number of characters does not match UTF-8 data")
+    finally:
+        free(starts)
+    return features
+
+
+cdef inline uint32_t rotl32(uint32_t x, int r) nogil:
+    return (x << r) | (x >> (32 - r))
+
+
+cdef inline uint32_t read32(const uint8_t *p) nogil:
+    return p[0] | (<uint32_t>p[1] << 8) | (<uint32_t>p[2] << 16) | (<uint32_t>p[3] << 24)
+
+
+cdef inline uint32_t round32(uint32_t acc, uint32_t lane) nogil:
+    acc = acc + lane * PRIME32_2
+    acc = rotl32(acc, 13)
+    return acc * PRIME32_1
+
+
+cdef uint32_t xxh32(const uint8_t *p, Py_ssize_t length) nogil:
+    cdef const uint8_t *end = p + length
+    cdef uint32_t v1, v2, v3, v4, h
+    if length >= 16:
+        v1 = PRIME32_1 + PRIME32_2
+        v2 = PRIME32_2
+        v3 = 0
+        v4 = 0 - PRIME32_1
+        while p + 16 <= end:
+            v1 = round32(v1, read32(p))
+            v2 = round32(v2, read32(p + 4))
+            v3 = round32(v3, read32(p + 8))
+            v4 = round32(v4, read32(p + 12))
+            p += 16
+        h = rotl32(v1, 1) + rotl32(v2, 7) + rotl32(v3, 12) + rotl32(v4, 18)
+    else:
+        h = PRIME32_5
+    h += <uint32_t>length
+    while p + 4 <= end:
+        h += read32(p) * PRIME32_3
+        h = rotl32(h, 17) * PRIME32_4
+        p += 4
+    while p < end:
+        h += p[0] * PRIME32_5
+        h = rotl32(h, 11) * PRIME32_1
+        p += 1
+    h ^= h >> 15
+    h *= PRIME32_2
+    h ^= h >> 13
+    h *= PRIME32_3
+    h ^= h >> 16
+    return h
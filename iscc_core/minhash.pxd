@@ -9,11 +9,11 @@ cdef uint64_t[64] MPA
 cdef uint64_t[64] MPB
 
 @cython.locals(a=uint64_t, b=uint64_t, f=uint64_t)
-cpdef list alg_minhash(list features)
+cpdef list alg_minhash(features)
 
-cpdef bytes alg_minhash_64(list features)
+cpdef bytes alg_minhash_64(features)
 
-cpdef bytes alg_minhash_256(list features)
+cpdef bytes alg_minhash_256(features)
 
-@cython.locals(bits=str, bitpos=uint8_t, h=uint64_t)
+@cython.locals(bits=list, bitpos=uint8_t, h=uint64_t)
 cpdef bytes alg_minhash_compress(list mhash, int lsb=*)
@@ -1,27 +1,96 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import List, Sequence
+from iscc_core.utils import pack_bits
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = [
+    "alg_minhash",
+    "alg_minhash_np",
+    "alg_minhash_update",
+    "alg_minhash_64",
+    "alg_minhash_256",
+    "alg_minhash_compress",
+    "MINHASH_BLOCK_SIZE",
+]
 
 
 def alg_minhash(features):
-    # type: (List[int]) -> List[int]
+    # type: (Sequence[int]) -> List[int]
     """
     Calculate a 64 dimensional minhash integer vector.
 
-    :param List[int] features: List of integer features
+    Uses the vectorized [`alg_minhash_np`][iscc_core.minhash.alg_minhash_np] if NumPy is
+    installed.
+
+    :param Sequence[int] features: Sequence of integer features
     :return: Minhash vector
     :rtype: List[int]
     """
+    if np is not None and len(features):
+        try:
+            return alg_minhash_np(features)
+        except OverflowError:
+            pass  # Features outside of uint64 range
     return [
         min([(((a * f + b) & MAXI64) % MPRIME) & MAXH for f in features]) for a, b in zip(MPA, MPB)
     ]
 
 
+def alg_minhash_np(features):
+    # type: (Sequence[int]) -> List[int]
+    """
+    Calculate a 64 dimensional minhash integer vector with NumPy.
+
+    Processes the features in blocks of `MINHASH_BLOCK_SIZE` with uint64 arithmetic.
+    Wrap-around of uint64 multiplication and addition is equivalent to masking with `MAXI64`,
+    so the result is identical to the pure Python implementation.
+
+    :param Sequence[int] features: Sequence of unsigned 64-bit integer features
+    :return: Minhash vector
+    :rtype: List[int]
+    """
+    f = np.asarray(features, dtype=np.uint64)
+    if not f.size:
+        raise ValueError("Cannot calculate minhash of empty features")
+    a = np.array(MPA, dtype=np.uint64)[:, None]
+    b = np.array(MPB, dtype=np.uint64)[:, None]
+    mhash = np.full(len(MPA), MAXH, dtype=np.uint64)
+    for start in range(0, f.size, MINHASH_BLOCK_SIZE):
+        block = f[None, start : start + MINHASH_BLOCK_SIZE]
+        hashes = (a * block + b) % np.uint64(MPRIME) & np.uint64(MAXH)
+        np.minimum(mhash, hashes.min(axis=1), out=mhash)
+    return mhash.tolist()
+
+
+def alg_minhash_update(mhash, features):
+    # type: (List[int]|None, List[int]) -> List[int]
+    """
+    Fold features into a running minhash vector.
+
+    The minhash of the union of two feature sets is the element-wise minimum of their minhash
+    vectors. This allows calculating the minhash of a large feature stream in constant memory.
+
+    :param List[int]|None mhash: Running minhash vector (None for the first batch of features)
+    :param List[int] features: List of integer features
+    :return: Updated minhash vector
+    :rtype: List[int]
+    """
+    update = alg_minhash(features)
+    if mhash is None:
+        return update
+    return [min(a, b) for a, b in zip(mhash, update)]
+
+
 def alg_minhash_64(features):
-    # type: (List[int]) -> bytes
+    # type: (Sequence[int]) -> bytes
     """
     Create 64-bit minimum hash digest.
 
-    :param List[int] features: List of integer features
+    :param Sequence[int] features: Sequence of integer features
     :return: 64-bit binary from the least significant bits of the minhash values
     :rtype: bytes
     """
@@ -29,11 +98,11 @@ def alg_minhash_64(features):
 
 
 def alg_minhash_256(features):
-    # type: (List[int]) -> bytes
+    # type: (Sequence[int]) -> bytes
     """
     Create 256-bit minimum hash digest.
 
-    :param List[int] features: List of integer features
+    :param Sequence[int] features: Sequence of integer features
     :return: 256-bit binary from the least significant bits of the minhash values
     :rtype: bytes
     """
@@ -54,16 +123,14 @@ def alg_minhash_compress(mhash, lsb=4):
     :return: 256-bit binary from the least significant bits of the minhash values
     :rtype: bytes
     """
-    bits: str = ""
-    for bitpos in range(lsb):
-        for h in mhash:
-            bits += str(h >> bitpos & 1)
-    return int(bits, 2).to_bytes((len(bits) + 7) // 8, "big")
+    bits = [h >> bitpos & 1 for bitpos in range(lsb) for h in mhash]
+    return pack_bits(bits)
 
 
 MAXI64 = (1 << 64) - 1
 MPRIME = (1 << 61) - 1
 MAXH = (1 << 32) - 1
+MINHASH_BLOCK_SIZE = 4096
 
 MPA = [
     853146490016488653,
@@ -44,6 +44,10 @@ class CoreOptions(BaseSettings):
         13, description="Number of characters per feature hash (size of sliding window)"
     )
 
+    text_avg_chunk_size: int = Field(
+        256, description="Target chunk size for granular text features in number of characters"
+    )
+
     text_unicode_filter: frozenset = Field(
         frozenset(
             {
@@ -78,6 +82,15 @@ class CoreOptions(BaseSettings):
         64, description="Default length of generated Content-Code Audio in bits"
     )
 
+    audio_segment_size: int = Field(
+        240,
+        description="Number of Chromaprint features per segment for granular audio features",
+    )
+
+    audio_segment_step: int = Field(
+        40, description="Number of Chromaprint features between the starts of audio segments"
+    )
+
     video_bits: int = Field(
         64, description="Default length of generated Content-Code Video in bits"
     )
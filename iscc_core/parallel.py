@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""*Parallel ISCC-UNIT generation with a process pool.*
+
+Fans out hashing of many files or texts to worker processes. Results are yielded in input order
+while the number of in-flight tasks is bounded, so arbitrarily long inputs can be processed with
+constant memory. Errors are captured per input so a single bad file does not abort a batch.
+
+Worker processes are started with the `spawn` method. Forking a process after the multithreaded
+blake3 hasher has been used may deadlock the forked workers.
+"""
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Tuple
+import xxhash
+import iscc_core as ic
+
+__all__ = [
+    "gen_codes_batch",
+    "gen_text_codes",
+    "gen_data_code_parallel",
+    "soft_hash_data_parallel",
+]
+
+UNITS = ("data", "instance")
+#: Minimum size of file segments for parallel Data-Code generation in number of bytes
+SEGMENT_MIN_SIZE = 32 * 1024 * 1024
+#: Number of leading chunks per segment reported individually for boundary stitching
+SEGMENT_SYNC_CHUNKS = 64
+
+
+def gen_codes_batch(paths, units=UNITS, workers=None):
+    # type: (Iterable[str|Path], Tuple[str, ...], int|None) -> Iterator[dict]
+    """
+    Generate ISCC Data-Codes and/or Instance-Codes for many files in parallel.
+
+    Each result has a `path` property and either `units` (Data-Code before Instance-Code),
+    `datahash` and `filesize` (if the Instance-Code was requested) or an `error` message.
+
+    :param Iterable[str|Path] paths: Paths of the files to be processed.
+    :param Tuple[str, ...] units: Units to generate ("data" and/or "instance").
+    :param int|None workers: Number of worker processes (default: number of CPUs).
+    :return: Generator of ISCC objects in input order.
+    :rtype: Iterator[dict]
+    """
+    if not units or not set(units) <= set(UNITS):
+        raise ValueError(f"Units must be a non-empty selection of {UNITS} not {units}")
+    units = tuple(unit for unit in UNITS if unit in units)
+    workers = workers or os.cpu_count()
+    with process_pool(workers) as executor:
+        tasks = ((path, units) for path in paths)
+        yield from imap_ordered(executor, gen_codes_file, tasks, window=2 * workers)
+
+
+def gen_text_codes(texts, bits=ic.core_opts.text_bits, workers=None, chunksize=16):
+    # type: (Iterable[str|Path], int, int|None, int) -> Iterator[dict]
+    """
+    Generate ISCC Text-Codes for many texts in parallel.
+
+    Texts are sent to worker processes in batches of `chunksize` to reduce inter-process
+    overhead. Each text is pickled once and only the small results are sent back. Pass `Path`
+    objects of UTF-8 encoded text files instead of strings to let the workers read the texts
+    themselves, so large texts are never transferred between processes.
+
+    Results of `Path` inputs have an additional `path` property. Errors are captured per input
+    as an `error` message.
+
+    :param Iterable[str|Path] texts: Plain texts or paths to plain text files.
+    :param int bits: Bit-length of ISCC Text-Code (default 64).
+    :param int|None workers: Number of worker processes (default: number of CPUs).
+    :param int chunksize: Number of texts per task.
+    :return: Generator of ISCC objects in input order.
+    :rtype: Iterator[dict]
+    """
+    workers = workers or os.cpu_count()
+    with process_pool(workers) as executor:
+        tasks = ((batch, bits) for batch in batched(texts, chunksize))
+        for results in imap_ordered(executor, gen_text_code_batch, tasks, window=2 * workers):
+            yield from results
+
+
+def gen_data_code_parallel(path, bits=ic.core_opts.data_bits, workers=None):
+    # type: (str|Path, int, int|None) -> dict
+    """
+    Create an ISCC Data-Code for a single large file using multiple processes.
+
+    The result is identical to [`gen_data_code_file`][iscc_core.code_data.gen_data_code_file].
+
+    :param str|Path path: Path to the file.
+    :param int bits: Bit-length of ISCC Data-Code (default 64).
+    :param int|None workers: Number of worker processes (default: number of CPUs).
+    :return: ISCC object with Data-Code
+    :rtype: dict
+    """
+    data_code = ic.encode_component(
+        mtype=ic.MT.DATA,
+        stype=ic.ST.NONE,
+        version=ic.VS.V0,
+        bit_length=bits,
+        digest=soft_hash_data_parallel(path, workers=workers),
+    )
+    return dict(iscc="ISCC:" + data_code)
+
+
+def soft_hash_data_parallel(path, workers=None, segment_size=None):
+    # type: (str|Path, int|None, int|None) -> bytes
+    """
+    Create a Data-Hash digest for a single large file using multiple processes.
+
+    The file is split into segments that are chunked independently by worker processes.
+    Each worker starts chunking at the beginning of its segment and continues up to the first
+    cut point at or beyond the end of its segment. Content defined chunking resynchronizes
+    after a few chunks, so the sequential chunk sequence reaching into a segment usually
+    meets a cut point reported by the worker. From there on the worker results are adopted.
+    Chunks before the resynchronization point are re-chunked sequentially. If no cut point
+    matches within the first `SEGMENT_SYNC_CHUNKS` chunks (e.g. for long runs of identical
+    bytes) the whole segment is re-chunked sequentially. The resulting features and digest
+    are identical to the sequential [`DataHasherV0`][iscc_core.code_data.DataHasherV0].
+
+    :param str|Path path: Path to the file.
+    :param int|None workers: Number of worker processes (default: number of CPUs).
+    :param int|None segment_size: Segment size in bytes (default: filesize / workers but at
+        least `SEGMENT_MIN_SIZE`).
+    :return: 256-bit Data-Hash (soft-hash) digest used as body for Data-Code
+    :rtype: bytes
+    """
+    workers = workers or os.cpu_count()
+    filesize = os.path.getsize(path)
+    segment_size = segment_size or max(SEGMENT_MIN_SIZE, -(-filesize // workers))
+    if filesize <= segment_size:
+        hasher = ic.DataHasherV0()
+        for view in ic.mmap_views(path):
+            hasher.push(view)
+        return hasher.digest()
+
+    segments = [(path, start, start + segment_size) for start in range(0, filesize, segment_size)]
+    mhash = None
+    pos = 0
+    with process_pool(workers) as executor, open(path, "rb") as infile:
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            results = imap_ordered(executor, hash_data_segment, segments, window=workers)
+            for (_, _, end), (head, body, end_cut) in zip(segments, results):
+                if pos >= end:
+                    continue  # Segment is covered by a chunk that started in a previous segment
+                features, pos, body = stitch_data_segment(view, pos, end, head, body, end_cut)
+                if features:
+                    mhash = ic.alg_minhash_update(mhash, features)
+                if body is not None:
+                    mhash = body if mhash is None else [min(a, b) for a, b in zip(mhash, body)]
+    return ic.alg_minhash_compress(mhash, 4)
+
+
+def hash_data_segment(path, start, end):
+    # type: (str|Path, int, int) -> Tuple[List[Tuple[int, int]], List[int]|None, int]
+    """
+    Chunk and hash a file segment starting at `start` up to the first cut point beyond `end`.
+
+    :param str|Path path: Path to the file.
+    :param int start: Offset where chunking starts.
+    :param int end: Offset of the end of the segment.
+    :return: Tuple of (head, body, end_cut) with `head` as (offset, feature) tuples of the first
+        `SEGMENT_SYNC_CHUNKS` chunks, `body` as minhash vector of the remaining chunks (or None)
+        and `end_cut` as the offset where the last chunk of the segment ends.
+    :rtype: Tuple[List[Tuple[int, int]], List[int]|None, int]
+    """
+    avg_chunk_size = ic.core_opts.data_avg_chunk_size
+    max_chunk_size = ic.cdc.alg_cdc_params(avg_chunk_size)[1]
+    head, features, body = [], [], None
+    with open(path, "rb") as infile:
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            window = view[start : end + max_chunk_size]
+            end_cut = start
+            for offset, size in ic.alg_cdc_spans(window, avg_chunk_size=avg_chunk_size):
+                if start + offset >= end:
+                    break
+                feature = xxhash.xxh32_intdigest(window[offset : offset + size])
+                if len(head) < SEGMENT_SYNC_CHUNKS:
+                    head.append((start + offset, feature))
+                else:
+                    features.append(feature)
+                    if len(features) >= ic.MINHASH_BLOCK_SIZE:
+                        body = ic.alg_minhash_update(body, features)
+                        features = []
+                end_cut = start + offset + size
+            window.release()
+    if features:
+        body = ic.alg_minhash_update(body, features)
+    return head, body, end_cut
+
+
+def stitch_data_segment(view, pos, end, head, body, end_cut):
+    # type: (memoryview, int, int, List[Tuple[int, int]], List[int]|None, int) -> tuple
+    """
+    Continue the sequential chunk sequence at `pos` through a segment hashed by a worker.
+
+    Chunks are re-chunked sequentially from `pos` until a cut point matches one of the
+    `head` offsets reported by the worker. From there on the worker results are adopted.
+
+    :param memoryview view: Content of the whole file.
+    :param int pos: Offset of the next chunk of the sequential chunk sequence.
+    :param int end: Offset of the end of the segment.
+    :param List[Tuple[int, int]] head: Offsets and features of the first chunks of the segment.
+    :param List[int]|None body: Minhash vector of the remaining chunks of the segment.
+    :param int end_cut: Offset where the last chunk of the segment ends.
+    :return: Tuple of (features, pos, body) with the features to be added, the offset of
+        the next chunk and the minhash vector to be merged (None if not adopted).
+    :rtype: tuple
+    """
+    avg_chunk_size = ic.core_opts.data_avg_chunk_size
+    max_chunk_size = ic.cdc.alg_cdc_params(avg_chunk_size)[1]
+    head_index = {offset: idx for idx, (offset, _) in enumerate(head)}
+    features = []
+    if pos not in head_index:
+        window = view[pos : end + max_chunk_size]
+        base, pos = pos, pos + len(window)
+        for offset, size in ic.alg_cdc_spans(window, avg_chunk_size=avg_chunk_size):
+            if base + offset in head_index or base + offset >= end:
+                pos = base + offset
+                break
+            features.append(xxhash.xxh32_intdigest(window[offset : offset + size]))
+        window.release()
+        if pos not in head_index:
+            return features, pos, None
+    features.extend(feature for _, feature in head[head_index[pos] :])
+    return features, end_cut, body
+
+
+def gen_codes_file(path, units=UNITS):
+    # type: (str|Path, Tuple[str, ...]) -> dict
+    """
+    Generate ISCC Data-Code and/or Instance-Code for a single file and capture errors.
+
+    :param str|Path path: Path to the file.
+    :param Tuple[str, ...] units: Units to generate ("data" and/or "instance").
+    :return: ISCC object with `path` and `units`, `datahash`, `filesize` or `error`.
+    :rtype: dict
+    """
+    try:
+        if units == UNITS:
+            result = ic.gen_data_instance_codes_file(path)
+        elif units == ("data",):
+            result = dict(units=[ic.gen_data_code_file(path)["iscc"]])
+        else:
+            result = ic.gen_instance_code_file(path)
+            result["units"] = [result.pop("iscc")]
+    except Exception as e:
+        return dict(path=str(path), error=f"{type(e).__name__}: {e}")
+    return dict(path=str(path), **result)
+
+
+def gen_text_code_batch(texts, bits=ic.core_opts.text_bits):
+    # type: (List[str|Path], int) -> List[dict]
+    """
+    Generate ISCC Text-Codes for a batch of texts and capture errors.
+
+    :param List[str|Path] texts: Plain texts or paths to plain text files.
+    :param int bits: Bit-length of ISCC Text-Code (default 64).
+    :return: ISCC objects with Text-Code and `characters` or `error`.
+    :rtype: List[dict]
+    """
+    results = []
+    for text in texts:
+        result = dict(path=str(text)) if isinstance(text, Path) else {}
+        try:
+            if isinstance(text, Path):
+                text = text.read_text(encoding="utf-8")
+            result.update(ic.gen_text_code_v0(text, bits))
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        results.append(result)
+    return results
+
+
+def batched(iterable, size):
+    # type: (Iterable, int) -> Iterator[list]
+    """
+    Split an iterable into lists of `size` items (the last list may be shorter).
+
+    :param Iterable iterable: Items to be batched.
+    :param int size: Number of items per batch.
+    :return: Generator of batches.
+    :rtype: Iterator[list]
+    """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+def process_pool(workers):
+    # type: (int) -> ProcessPoolExecutor
+    """
+    Create a process pool executor with spawned worker processes.
+
+    :param int workers: Number of worker processes.
+    :return: Process pool executor
+    :rtype: ProcessPoolExecutor
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def imap_ordered(executor, func, tasks, window):
+    # type: (Executor, Callable, Iterable[tuple], int) -> Iterator
+    """
+    Map `func` over argument tuples with an executor and yield results in input order.
+
+    At most `window` tasks are submitted but not yet yielded at any time.
+
+    :param Executor executor: Executor to run the tasks.
+    :param Callable func: Function to be called with the unpacked argument tuples.
+    :param Iterable[tuple] tasks: Argument tuples for `func`.
+    :param int window: Maximum number of in-flight tasks.
+    :return: Generator of results in input order.
+    :rtype: Iterator
+    """
+    pending = deque()
+    for args in tasks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, *args))
+    while pending:
+        yield pending.popleft().result()
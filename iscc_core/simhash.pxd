@@ -1 +1,10 @@
+import cython
+from libc.stdint cimport uint64_t
+
+
+@cython.locals(n_bytes=uint64_t, n_bits=uint64_t, n_digests=uint64_t, end=uint64_t, i=uint64_t)
 cpdef bytes alg_simhash(list[bytes] hash_digests)
+
+
+@cython.locals(n_bytes=uint64_t, n_bits=uint64_t, i=uint64_t)
+cpdef bytes alg_simhash_weighted(list[bytes] hash_digests, weights)
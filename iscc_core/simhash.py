@@ -1,12 +1,30 @@
 # -*- coding: utf-8 -*-
+import sys
+from itertools import chain, compress
+from math import fsum
+from typing import Sequence
 from bitarray import bitarray
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = [
+    "alg_simhash",
+    "alg_simhash_weighted",
+]
+
 
 def alg_simhash(hash_digests):
     # type: (list[bytes]) -> bytes
     """
     Creates a similarity preserving hash from a sequence of equal sized hash digests.
 
+    The digests are concatenated into a single bit matrix (one row per digest). The number of
+    set bits per column is counted with strided popcounts, so the runtime scales linearly with
+    the number of digests without a Python loop over individual bits.
+
     :param list hash_digests: A sequence of equaly sized byte-hashes.
     :returns: Similarity byte-hash
     :rtype: bytes
@@ -14,19 +32,85 @@ def alg_simhash(hash_digests):
 
     n_bytes = len(hash_digests[0])
     n_bits = n_bytes * 8
-    vector = [0] * n_bits
+    matrix = bitarray()
+    matrix.frombytes(b"".join(hash_digests))
+    if len(matrix) != n_bits * len(hash_digests):
+        raise ValueError("Hash digests must be of equal size")
+
+    end = len(matrix)
+    n_digests = len(hash_digests)
+    shash = bitarray(n_bits)
+    for i in range(n_bits):
+        shash[i] = 2 * matrix.count(1, i, end, n_bits) >= n_digests
+
+    return shash.tobytes()
+
+
+def alg_simhash_weighted(hash_digests, weights):
+    # type: (list[bytes], Sequence[float]) -> bytes
+    """
+    Creates a similarity preserving hash from equal sized hash digests with per-digest weights.
+
+    A bit is set in the result if the total weight of the digests that have the bit set is at
+    least the total weight of the digests that have it unset. Near-ties are decided with exact
+    summation, so with equal weights the result is identical to
+    [`alg_simhash`][iscc_core.simhash.alg_simhash].
+
+    Column weights are summed with NumPy in blocks of `SIMHASH_BLOCK_SIZE` digests if NumPy is
+    installed.
 
-    for digest in hash_digests:
-        h = bitarray()
-        h.frombytes(digest)
-        for i in range(n_bits):
-            vector[i] += h[i]
+    !!! warning
+        This is an experimental algorithm that is not part of the ISCC standard. It is not used
+        by any of the standard ISCC-UNIT generators and results are not conformant.
 
-    minfeatures = len(hash_digests) / 2
-    shash = 0
+    :param list hash_digests: A sequence of equaly sized byte-hashes.
+    :param Sequence[float] weights: A non-negative weight for each hash digest.
+    :returns: Similarity byte-hash
+    :rtype: bytes
+    """
 
+    n_bytes = len(hash_digests[0])
+    n_bits = n_bytes * 8
+    n_digests = len(hash_digests)
+    if len(weights) != n_digests:
+        raise ValueError("Number of weights must match number of hash digests")
+    data = b"".join(hash_digests)
+    matrix = bitarray()
+    matrix.frombytes(data)
+    if len(matrix) != n_bits * n_digests:
+        raise ValueError("Hash digests must be of equal size")
+
+    weights = [float(w) for w in weights]
+    if np is None:
+        column_weights = [sum(compress(weights, matrix[i::n_bits])) for i in range(n_bits)]
+    else:
+        weight_array = np.array(weights, dtype=np.float64)
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(n_digests, n_bytes)
+        column_weights = np.zeros(n_bits, dtype=np.float64)
+        for start in range(0, n_digests, SIMHASH_BLOCK_SIZE):
+            bits = np.unpackbits(rows[start : start + SIMHASH_BLOCK_SIZE], axis=1)
+            column_weights += weight_array[start : start + SIMHASH_BLOCK_SIZE] @ bits
+        column_weights = column_weights.tolist()
+
+    # Columns within the rounding error of a tie are decided with exact summation
+    total = sum(weights)
+    tolerance = 4 * n_digests * EPSILON * total
+    negated = [-w for w in weights]
+    shash = bitarray(n_bits)
     for i in range(n_bits):
-        if vector[i] >= minfeatures:
-            shash |= 1 << (n_bits - 1 - i)
+        margin = 2 * column_weights[i] - total
+        if abs(margin) > tolerance:
+            shash[i] = margin > 0
+        else:
+            shash[i] = weighted_majority(weights, negated, matrix[i::n_bits])
+    return shash.tobytes()
+
+
+def weighted_majority(weights, negated, column):
+    # type: (list[float], list[float], bitarray) -> bool
+    """Check with exact summation if set bits of `column` carry at least half of the weight."""
+    return fsum(chain(compress(weights, column), compress(negated, ~column))) >= 0
+
 
-    return shash.to_bytes(n_bytes, "big")
+SIMHASH_BLOCK_SIZE = 4096
+EPSILON = sys.float_info.epsilon
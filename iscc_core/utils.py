@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import io
 import json
+import mmap
+import os
+from concurrent.futures import Executor
+from pathlib import Path
 from hashlib import sha256
-from typing import Generator, Sequence, Tuple, Any
+from typing import AsyncIterator, Generator, Sequence, Tuple, Any
 import uvarint
 from bitarray import bitarray
 from bitarray.util import count_xor
 from blake3 import blake3
 import iscc_core as ic
 import jcs
-from iscc_core.constants import Stream
+from iscc_core.constants import AsyncStream, Stream
 
 __all__ = [
     "iscc_nph_similarity",
@@ -19,6 +24,8 @@ __all__ = [
     "cidv1_to_token_id",
     "cidv1_from_token_id",
     "sliding_window",
+    "mmap_views",
+    "aiter_data",
     "iscc_similarity",
     "iscc_compare",
     "iscc_distance",
@@ -263,6 +270,100 @@ def sliding_window(seq, width):
     return (seq[i : i + width] for i in idx)
 
 
+def pack_bits(bits):
+    # type: (Sequence[int]) -> bytes
+    """
+    Pack a sequence of bit values (0/1 or bool) into big-endian bytes.
+
+    Bits are left-padded with zeros to full bytes, so the result equals the big-endian
+    integer conversion `int(bitstring, 2).to_bytes(...)` of the corresponding bitstring.
+
+    :param Sequence[int] bits: Bit values with the most significant bit first
+    :return: Packed bits
+    :rtype: bytes
+    """
+    packed = bitarray(-len(bits) % 8)
+    packed.setall(0)
+    packed.pack(bytes(bits))
+    return packed.tobytes()
+
+
+def mmap_views(path, size=ic.core_opts.io_read_size):
+    # type: (str|Path, int) -> Generator[memoryview, None, None]
+    """
+    Generate read-only memoryview slices of a memory-mapped file without copying data.
+
+    Each slice is released when the next one is produced, so consumers must not keep
+    references to yielded views. Empty files produce no views.
+
+    :param str|Path path: Path to the file to be read.
+    :param int size: Size of the yielded slices in number of bytes.
+    :returns: A generator of memoryview slices of the file content
+    :rtype: Generator[memoryview]
+    """
+    with open(path, "rb") as infile:
+        if not os.fstat(infile.fileno()).st_size:
+            return
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            for offset in range(0, len(view), size):
+                with view[offset : offset + size] as piece:
+                    yield piece
+
+
+async def aiter_data(source, size=ic.core_opts.io_read_size):
+    # type: (AsyncStream, int) -> AsyncIterator[bytes]
+    """
+    Iterate over the non-empty byte buffers of an asynchronous data source.
+
+    Data is only read from the source when the consumer requests the next buffer, so a slow
+    consumer applies backpressure to the source.
+
+    :param AsyncStream source: Async iterable of bytes or reader with an async `read` method
+        (e.g. `asyncio.StreamReader` or `aiohttp.StreamReader`).
+    :param int size: Maximum number of bytes per `read` call.
+    :returns: An async generator of byte buffers
+    :rtype: AsyncIterator[bytes]
+    """
+    if hasattr(source, "read"):
+        data = await source.read(size)
+        while data:
+            yield data
+            data = await source.read(size)
+    else:
+        async for data in source:
+            if data:
+                yield data
+
+
+class AsyncPushMixin:
+    """Non-blocking push methods for incremental hashers with a `push` method."""
+
+    async def apush(self, data, executor=None):
+        # type: (ic.Data, Executor|None) -> None
+        """
+        Push data in `executor` so the event loop is not blocked.
+
+        Calls to `apush` on the same hasher must be awaited one after the other.
+
+        :param Data data: Data to be hashed
+        :param Executor|None executor: Executor for hashing (default: the loop's default executor).
+        """
+        await asyncio.get_running_loop().run_in_executor(executor, self.push, data)
+
+    async def apush_source(self, source, executor=None):
+        # type: (AsyncStream, Executor|None) -> None
+        """
+        Push all buffers of an asynchronous data source.
+
+        The next buffer is only read from `source` after the previous one has been hashed.
+
+        :param AsyncStream source: Async iterable of bytes or `asyncio.StreamReader`.
+        :param Executor|None executor: Executor for hashing (default: the loop's default executor).
+        """
+        async for data in aiter_data(source):
+            await self.apush(data, executor=executor)
+
+
 def iscc_compare(a, b):
     # type: (str, str) -> dict
     """
@@ -1,18 +1,20 @@
 # -*- coding: utf-8 -*-
 from typing import Sequence
-from bitarray import bitarray
+from iscc_core.utils import pack_bits
+
+__all__ = [
+    "alg_wtahash",
+    "WTA_VIDEO_ID_PERMUTATIONS",
+]
 
 
 def alg_wtahash(vec: Sequence[float], bits) -> bytes:
     """Calculate WTA Hash for vector with 380 values (MP7 frame signature)."""
-    h = []
-    for perm in WTA_VIDEO_ID_PERMUTATIONS:
-        v = vec[perm[0]], vec[perm[1]]
-        h.append(v.index(max(v)))
-        if len(h) == bits:
-            break
-    h = bitarray(h).tobytes()
-    return h
+    # Bit is set if the second value of a permutation pair wins (ties go to the first)
+    h = [vec[b] > vec[a] for a, b in WTA_VIDEO_ID_PERMUTATIONS[:bits]]
+    # Pad on the right to full bytes (pack_bits would pad on the left)
+    h += [False] * (-len(h) % 8)
+    return pack_bits(h)
 
 
 WTA_VIDEO_ID_PERMUTATIONS = (
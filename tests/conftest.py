@@ -41,3 +41,9 @@ def static_bytes(n: int = MB1, block_size: int = 4) -> bytes:
         n -= take
         i += 1
     return data.getvalue()
+
+
+async def async_pieces(data, size):
+    """Yields `data` in pieces of `size` bytes as an async data source for testing."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from array import array
 from blake3 import blake3
 from .conftest import static_bytes
 import iscc_core.cdc
@@ -96,3 +97,43 @@ def test_data_chunks_utf32():
     hashes = [blake3(c).hexdigest() for c in iscc_core.cdc.alg_cdc_chunks(data, True)]
     assert len(hashes) == 9
     assert hashes == expected
+
+
+def test_data_spans_empty():
+    assert list(iscc_core.cdc.alg_cdc_spans(b"")) == []
+
+
+def test_data_spans_match_chunks():
+    data = static_bytes(8192 + 1000)
+    chunks = list(iscc_core.cdc.alg_cdc_chunks(data, False))
+    spans = list(iscc_core.cdc.alg_cdc_spans(data))
+    assert [data[o : o + s] for o, s in spans] == chunks
+
+
+def test_data_spans_1mib(static_bytes):
+    spans = list(iscc_core.cdc.alg_cdc_spans(static_bytes))
+    assert len(spans) == 1018
+    assert sum(s for o, s in spans) == len(static_bytes)
+    assert [len(c) for c in iscc_core.cdc.alg_cdc_chunks(static_bytes, False)] == [
+        s for o, s in spans
+    ]
+
+
+def test_data_chunks_spans_non_byte_buffer():
+    data = array("H", range(30000))
+    raw = data.tobytes()
+    assert list(iscc_core.cdc.alg_cdc_chunks(data, False)) == list(
+        iscc_core.cdc.alg_cdc_chunks(raw, False)
+    )
+    assert list(iscc_core.cdc.alg_cdc_spans(data)) == list(iscc_core.cdc.alg_cdc_spans(raw))
+
+
+def test_data_spans_custom_gear(monkeypatch):
+    gear = tuple(reversed(iscc_core.core_opts.cdc_gear))
+    monkeypatch.setattr(iscc_core.core_opts, "cdc_gear", gear)
+    data = static_bytes(100000)
+    chunks = list(iscc_core.cdc.alg_cdc_chunks(data, False))
+    spans = list(iscc_core.cdc.alg_cdc_spans(data))
+    assert [data[o : o + s] for o, s in spans] == chunks
+    monkeypatch.undo()
+    assert spans != list(iscc_core.cdc.alg_cdc_spans(data))
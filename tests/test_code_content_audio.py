@@ -1,4 +1,9 @@
 # -*- coding: utf-8 -*-
+import random
+from array import array
+import pytest
+from more_itertools import divide
+import iscc_core as ic
 import iscc_core.code_content_audio
 
 
@@ -82,6 +87,123 @@ def test_gen_audio_code_schema_conformance():
     assert iscc_obj == {"iscc": "ISCC:EIAWUJFCEZZOJYVD"}
 
 
+def soft_hash_audio_reference(cv, bits=64):
+    """Per-feature bytes digests (previous implementation of `soft_hash_audio_v0`)."""
+    digests = [int_feature.to_bytes(4, "big", signed=True) for int_feature in cv]
+    if not digests:
+        return b"\x00" * 32
+    parts = [ic.alg_simhash(digests)]
+    bit_length = 32
+    for n, features in ((4, digests), (3, [f.to_bytes(4, "big", signed=True) for f in sorted(cv)])):
+        for bucket in divide(n, features):
+            bucket = list(bucket)
+            parts.append(ic.alg_simhash(bucket) if bucket else b"\x00\x00\x00\x00")
+            bit_length += 32
+            if bit_length == bits:
+                return b"".join(parts)
+    return b"".join(parts)
+
+
+@pytest.mark.parametrize("bits", [32, 64, 96, 128, 160, 192, 224, 256])
+def test_soft_hash_audio_v0_matches_reference(bits):
+    rnd = random.Random(bits)
+    for size in list(range(10)) + [101, 1000]:
+        cv = [rnd.randint(-(2**31), 2**31 - 1) for _ in range(size)]
+        expected = soft_hash_audio_reference(cv, bits)
+        assert iscc_core.code_content_audio.soft_hash_audio_v0(cv, bits) == expected
+        assert iscc_core.code_content_audio.soft_hash_audio_v0(iter(cv), bits) == expected
+
+
+def test_soft_hash_audio_v0_array():
+    expected = iscc_core.code_content_audio.soft_hash_audio_v0(CHROMA_VECTOR, bits=256)
+    cv = array("i", CHROMA_VECTOR)
+    assert iscc_core.code_content_audio.soft_hash_audio_v0(cv, bits=256) == expected
+    assert cv.tolist() == CHROMA_VECTOR
+
+
+def test_soft_hash_audio_v0_numpy():
+    np = pytest.importorskip("numpy")
+    expected = iscc_core.code_content_audio.soft_hash_audio_v0(CHROMA_VECTOR, bits=256)
+    for dtype in (np.int32, np.int64, ">i4"):
+        cv = np.array(CHROMA_VECTOR, dtype=dtype)
+        assert iscc_core.code_content_audio.soft_hash_audio_v0(cv, bits=256) == expected
+
+
+def test_soft_hash_audio_v0_pure_python(monkeypatch):
+    monkeypatch.setattr(iscc_core.code_content_audio, "np", None)
+    assert (
+        iscc_core.code_content_audio.soft_hash_audio_v0(CHROMA_VECTOR, bits=256).hex()
+        == "6a24a22672e4e2a33a4e88876a84a0266a24a2263a4ea0836264a22468842a2f"
+    )
+
+
+def test_soft_hash_audio_v0_overflow():
+    with pytest.raises(OverflowError):
+        iscc_core.code_content_audio.soft_hash_audio_v0([2**31])
+
+
+def test_soft_hash_audio_segments_v0():
+    rnd = random.Random(0)
+    cv = [rnd.randint(-(2**31), 2**31 - 1) for _ in range(1000)]
+    segments = iscc_core.code_content_audio.soft_hash_audio_segments_v0(cv, 110, 30)
+    assert segments["offsets"] == list(range(0, 871, 30)) + [890]
+    assert segments["sizes"] == [110] * len(segments["offsets"])
+    for simprint, offset in zip(segments["simprints"], segments["offsets"]):
+        expected = soft_hash_audio_reference(cv[offset : offset + 110], 64)
+        assert simprint == expected
+
+
+def test_soft_hash_audio_segments_v0_sub_clip():
+    rnd = random.Random(1)
+    broadcast = [rnd.randint(-(2**31), 2**31 - 1) for _ in range(2000)]
+    clip = broadcast[320:560]
+    segments = iscc_core.code_content_audio.soft_hash_audio_segments_v0(broadcast)
+    simprint = iscc_core.code_content_audio.soft_hash_audio_segments_v0(clip)["simprints"][0]
+    assert segments["offsets"][segments["simprints"].index(simprint)] == 320
+
+
+def test_soft_hash_audio_segments_v0_short():
+    segments = iscc_core.code_content_audio.soft_hash_audio_segments_v0(CHROMA_VECTOR, 1000)
+    assert segments["offsets"] == [0]
+    assert segments["sizes"] == [len(CHROMA_VECTOR)]
+    expected = iscc_core.code_content_audio.soft_hash_audio_v0(CHROMA_VECTOR, 64)
+    assert segments["simprints"] == [expected]
+
+
+def test_soft_hash_audio_segments_v0_empty():
+    segments = iscc_core.code_content_audio.soft_hash_audio_segments_v0([])
+    assert segments == dict(simprints=[bytes(8)], offsets=[0], sizes=[0])
+
+
+def test_soft_hash_audio_segments_v0_invalid():
+    with pytest.raises(ValueError):
+        iscc_core.code_content_audio.soft_hash_audio_segments_v0(CHROMA_VECTOR, 0)
+    with pytest.raises(ValueError):
+        iscc_core.code_content_audio.soft_hash_audio_segments_v0(CHROMA_VECTOR, 10, 0)
+
+
+def test_gen_audio_code_v0_granular():
+    result = iscc_core.code_content_audio.gen_audio_code_v0(iter(CHROMA_VECTOR), granular=True)
+    assert result["iscc"] == "ISCC:EIAWUJFCEZZOJYVD"
+    features = result["features"][0]
+    assert features["maintype"] == "content"
+    assert features["subtype"] == "audio"
+    assert features["version"] == 0
+    assert features["offsets"] == [0.0]
+    assert len(ic.decode_base64(features["simprints"][0])) == 8
+
+
+def test_column_counts_move():
+    rnd = random.Random(2)
+    cv = array("i", [rnd.randint(-(2**31), 2**31 - 1) for _ in range(100)])
+    matrix = iscc_core.code_content_audio.chromaprint_matrix(cv)
+    counts = iscc_core.code_content_audio.ColumnCounts(matrix)
+    for start, stop in [(0, 10), (5, 30), (30, 40), (60, 70), (10, 20)]:
+        counts.move(start, stop)
+        expected = iscc_core.code_content_audio.column_counts(matrix, start, stop)
+        assert counts.counts == expected
+
+
 CHROMA_VECTOR = [
     684003877,
     683946551,
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import math
+import random
 import pytest
 import iscc_core as ic
 
@@ -85,6 +87,104 @@ def test_dct_range():
     assert ic.alg_dct(range(64))[0] == 2016
 
 
+def dct_reference(v):
+    """Recursive list based DCT (previous implementation of `alg_dct`)."""
+    n = len(v)
+    if n == 1:
+        return list(v)
+    half = n // 2
+    alpha = [(v[i] + v[-(i + 1)]) for i in range(half)]
+    beta = [(v[i] - v[-(i + 1)]) / (math.cos((i + 0.5) * math.pi / n) * 2.0) for i in range(half)]
+    alpha = dct_reference(alpha)
+    beta = dct_reference(beta)
+    result = []
+    for i in range(half - 1):
+        result.append(alpha[i])
+        result.append(beta[i] + beta[i + 1])
+    result.append(alpha[-1])
+    result.append(beta[-1])
+    return result
+
+
+def test_dct_bit_exact_32():
+    rnd = random.Random(2)
+    for _ in range(64):
+        v = [rnd.randint(0, 255) for _ in range(32)]
+        assert ic.alg_dct(v) == dct_reference(v)
+        v = [rnd.uniform(-4096, 4096) for _ in range(32)]
+        assert ic.alg_dct(v) == dct_reference(v)
+
+
+def test_dct_non_power_of_two_raises():
+    with pytest.raises(ValueError):
+        ic.alg_dct([1, 2, 3, 4, 5, 6])
+
+
+def test_dct_table():
+    table = ic.dct.dct_table(8)
+    assert len(table) == 7
+    assert table[4:6].tolist() == [math.cos((i + 0.5) * math.pi / 4) * 2.0 for i in range(2)]
+    assert ic.dct.dct_table(8) is table
+
+
+def test_dct_np_bit_exact():
+    np = pytest.importorskip("numpy")
+    rnd = random.Random(0)
+    for n in (1, 2, 8, 32, 64):
+        vectors = [[rnd.uniform(-255, 255) for _ in range(n)] for _ in range(8)]
+        result = ic.dct.alg_dct_np(np.array(vectors)).tolist()
+        assert result == [ic.alg_dct(v) for v in vectors]
+
+
+def test_dct_np_odd_raises():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        ic.dct.alg_dct_np(np.zeros((2, 3)))
+
+
+def test_dct_2d_pure_python(monkeypatch):
+    rnd = random.Random(1)
+    matrix = [[rnd.randint(0, 255) for _ in range(32)] for _ in range(32)]
+    expected = ic.alg_dct_2d(matrix)
+    monkeypatch.setattr(ic.dct, "np", None)
+    assert ic.alg_dct_2d(matrix) == expected
+
+
+def test_soft_hash_image_v0_pure_python(monkeypatch):
+    monkeypatch.setattr(ic.dct, "np", None)
+    assert ic.gen_image_code_v0(IMG_SAMPLE_PIXELS, bits=256) == {
+        "iscc": "ISCC:EED4GQZQTY6J5DTHQ2DWCPDZHQOM6QZQTY6J5DTFZ2DWCPDZHQOMXDI"
+    }
+
+
+@pytest.mark.parametrize("bits", [64, 96, 256])
+def test_gen_image_codes_batch(bits):
+    rnd = random.Random(2)
+    images = [[rnd.randint(0, 255) for _ in range(1024)] for _ in range(300)]
+    images += [IMG_SAMPLE_PIXELS, IMG_WHITE_PIXELS, IMG_BLACK_PIXELS]
+    expected = [ic.gen_image_code_v0(image, bits=bits) for image in images]
+    assert ic.gen_image_codes_batch(images, bits=bits) == expected
+    assert ic.gen_image_codes_batch(bytes(sum(images, [])), bits=bits) == expected
+
+
+def test_gen_image_codes_batch_array():
+    np = pytest.importorskip("numpy")
+    images = np.array([IMG_SAMPLE_PIXELS, IMG_WHITE_PIXELS], dtype=np.uint8)
+    assert ic.gen_image_codes_batch(images, bits=256) == [
+        {"iscc": "ISCC:EED4GQZQTY6J5DTHQ2DWCPDZHQOM6QZQTY6J5DTFZ2DWCPDZHQOMXDI"},
+        ic.gen_image_code_v0(IMG_WHITE_PIXELS, bits=256),
+    ]
+
+
+def test_gen_image_codes_batch_empty():
+    assert ic.gen_image_codes_batch([]) == []
+
+
+def test_soft_hash_image_batch_v0_larger_256_raises():
+    with pytest.raises(AssertionError):
+        ic.soft_hash_image_batch_v0([IMG_SAMPLE_PIXELS], bits=288)
+
+
 def test_gen_image_code_schema_conformance():
     iscc_obj = ic.gen_image_code_v0(IMG_SAMPLE_PIXELS)
     assert iscc_obj == {"iscc": "ISCC:EEA4GQZQTY6J5DTH"}
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import random
+import unicodedata
 import pytest
+import xxhash
 import iscc_core
 
 TEXT_A = """
@@ -76,6 +79,28 @@ def test_normalize_text():
     assert iscc_core.code_content_text.text_collapse("Hello\nWorld") == "helloworld"
 
 
+def text_collapse_reference(text):
+    text = unicodedata.normalize("NFD", text).lower()
+    unicode_filter = iscc_core.core_opts.text_unicode_filter
+    text = "".join(
+        ch for ch in text if not ch.isspace() and unicodedata.category(ch)[0] not in unicode_filter
+    )
+    return unicodedata.normalize("NFKC", text)
+
+
+def test_text_collapse_all_code_points():
+    text = "".join(chr(cp) for cp in range(0x110000) if not 0xD800 <= cp <= 0xDFFF)
+    assert iscc_core.code_content_text.text_collapse(text) == text_collapse_reference(text)
+
+
+def test_collapse_table_cached():
+    table = iscc_core.code_content_text.collapse_table(frozenset({"P"}))
+    assert iscc_core.code_content_text.collapse_table(frozenset({"P"})) is table
+    assert "a, b!\u0301".translate(table) == "ab\u0301"
+    assert table[ord(",")] is None
+    assert table[ord("a")] == ord("a")
+
+
 def test_code_text_bytes_raises():
     with pytest.raises(TypeError):
         iscc_core.code_content_text.gen_text_code(b"", bits=64)
@@ -92,3 +117,130 @@ def test_code_text_empty():
 def test_gen_text_code_schema_conformance():
     iscc_obj = iscc_core.gen_text_code_v0("Hello World")
     assert iscc_obj == {"iscc": "ISCC:EAASKDNZNYGUUF5A", "characters": 10}
+
+
+def ngram_features_reference(text, ngram_size):
+    ngrams = iscc_core.sliding_window(text, ngram_size)
+    return [xxhash.xxh32_intdigest(s.encode("utf-8")) for s in ngrams]
+
+
+@pytest.mark.parametrize("ngram_size", [2, 13, 40])
+def test_alg_text_features(ngram_size):
+    for text in ("", "a", "abc", TEXT_A, "Iñtërnâtiônàlizætiøn☃💩" * 10, "ä" * 40):
+        features = iscc_core.alg_text_features(text, ngram_size)
+        assert features.typecode == "I"
+        assert features.tolist() == ngram_features_reference(text, ngram_size)
+
+
+def test_alg_text_features_raises():
+    with pytest.raises(AssertionError):
+        iscc_core.alg_text_features("abc", 1)
+
+
+def test_xxh32_ngrams():
+    fastngram = pytest.importorskip("iscc_core.fastngram")
+    text = "Iñtërnâtiônàlizætiøn☃💩 " * 20
+    for ngram_size in (2, 3, 13, 17, 40):
+        features = fastngram.xxh32_ngrams(text.encode("utf-8"), len(text), ngram_size)
+        assert features.tolist() == ngram_features_reference(text, ngram_size)
+    with pytest.raises(ValueError):
+        fastngram.xxh32_ngrams("äbcdef".encode("utf-8"), 7, 2)
+
+
+def text_hasher_result(pieces, bits=64):
+    hasher = iscc_core.TextHasherV0()
+    for piece in pieces:
+        hasher.push(piece)
+    return dict(iscc="ISCC:" + hasher.code(bits), characters=hasher.characters)
+
+
+def text_pieces(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 100000])
+def test_text_hasher(size):
+    for text in (TEXT_A, TEXT_B, TEXT_C):
+        expected = iscc_core.gen_text_code_v0(text, 128)
+        assert text_hasher_result(text_pieces(text, size), 128) == expected
+
+
+def test_text_hasher_short_and_empty():
+    assert text_hasher_result([]) == iscc_core.gen_text_code_v0("")
+    assert text_hasher_result(["Hel", "lo", "!"]) == iscc_core.gen_text_code_v0("Hello!")
+    assert text_hasher_result(["Hello Wor", "ld!!"]) == iscc_core.gen_text_code_v0("Hello World!!")
+    expected = iscc_core.gen_text_code_v0("Hello World")["iscc"]
+    assert "ISCC:" + iscc_core.TextHasherV0("Hello World").code() == expected
+
+
+def test_text_hasher_boundaries(monkeypatch):
+    # Combining marks, final sigma and Hangul jamo that must not be split at push boundaries
+    text = "Iñtërnâtiôn àlizætiøn ΟΔΟΣ ΟΔΟΣ. ᄀ" + "ᅡᆨ" * 3 + " ȩ́ ﬁ ｶﾞ Σ'Σ" * 4
+    for unicode_filter in (frozenset({"C", "M", "P"}), frozenset()):
+        monkeypatch.setattr(iscc_core.core_opts, "text_unicode_filter", unicode_filter)
+        expected = iscc_core.gen_text_code_v0(text)
+        for size in (1, 2, 3):
+            assert text_hasher_result(text_pieces(text, size)) == expected
+
+
+def test_text_hasher_bounded(monkeypatch):
+    monkeypatch.setattr(iscc_core, "MINHASH_BLOCK_SIZE", 100)
+    hasher = iscc_core.TextHasherV0()
+    for piece in text_pieces(TEXT_A * 20, 64):
+        hasher.push(piece)
+        assert len(hasher.raw) < 64
+        assert len(hasher.filtered) < 64
+        assert len(hasher.carry) < iscc_core.core_opts.text_ngram_size
+        assert len(hasher.pending) < 100
+    assert hasher.digest() == iscc_core.soft_hash_text_v0(iscc_core.text_collapse(TEXT_A * 20))
+
+
+def test_text_hasher_no_boundary():
+    # Without safe boundaries the raw text is carried and only new characters are scanned
+    text = "abcdefghij" * 20000
+    assert text_hasher_result(text_pieces(text, 100)) == iscc_core.gen_text_code_v0(text)
+
+
+def test_rfind_boundary_start():
+    boundaries = iscc_core.code_content_text.raw_boundaries
+    assert iscc_core.code_content_text.rfind_boundary("a b c", boundaries) == 3
+    assert iscc_core.code_content_text.rfind_boundary("a b c", boundaries, 4) == 0
+    assert iscc_core.code_content_text.rfind_boundary("a b c", boundaries, 3) == 3
+
+
+def test_soft_hash_text_chunks_v0():
+    text = iscc_core.text_collapse(TEXT_A * 10)
+    chunks = iscc_core.soft_hash_text_chunks_v0(text, avg_chunk_size=64)
+    assert len(chunks["simprints"]) == len(chunks["offsets"]) == len(chunks["sizes"]) > 1
+    assert all(len(simprint) == 8 for simprint in chunks["simprints"])
+    assert sum(chunks["sizes"]) == len(text)
+    for simprint, offset, size in zip(chunks["simprints"], chunks["offsets"], chunks["sizes"]):
+        features = iscc_core.alg_text_features(text[offset : offset + size])
+        assert simprint == iscc_core.alg_minhash_64(features)
+
+
+def test_soft_hash_text_chunks_v0_partial_match():
+    rnd = random.Random(42)
+    passage = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(5000))
+    text_a = iscc_core.text_collapse(TEXT_B) + passage
+    text_b = iscc_core.text_collapse(TEXT_C) + passage + iscc_core.text_collapse(TEXT_B)
+    simprints_a = iscc_core.soft_hash_text_chunks_v0(text_a, avg_chunk_size=64)["simprints"]
+    simprints_b = iscc_core.soft_hash_text_chunks_v0(text_b, avg_chunk_size=64)["simprints"]
+    assert len(set(simprints_a) & set(simprints_b)) >= 30
+
+
+def test_gen_text_code_v0_granular():
+    result = iscc_core.gen_text_code_v0(TEXT_A, granular=True)
+    assert result["iscc"] == iscc_core.gen_text_code_v0(TEXT_A)["iscc"]
+    features = result["features"][0]
+    assert features["maintype"] == "content"
+    assert features["subtype"] == "text"
+    assert features["version"] == 0
+    assert sum(features["sizes"]) == result["characters"]
+    assert len(iscc_core.decode_base64(features["simprints"][0])) == 8
+
+
+def test_gen_text_code_v0_granular_empty():
+    features = iscc_core.gen_text_code_v0("", granular=True)["features"][0]
+    assert features["offsets"] == [0]
+    assert features["sizes"] == [0]
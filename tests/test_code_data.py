@@ -1,6 +1,13 @@
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import random
+import pytest
+import xxhash
+from blake3 import blake3
 import iscc_core
+from .conftest import async_pieces
 
 
 def test_hash_data_v0(static_bytes):
@@ -89,3 +96,190 @@ def test_DataHasher(static_bytes):
 def test_gen_data_code_schema_conformance():
     iscc_obj = iscc_core.gen_data_code_v0(BytesIO(b"\xff"))
     assert iscc_obj == {"iscc": "ISCC:GAAV5ZIQC4WCUBIK"}
+
+
+def test_DataHasherV0_random_push_sizes(static_bytes):
+    random.seed(2)
+    expected = iscc_core.code_data.DataHasherV0(static_bytes).digest()
+    for _ in range(3):
+        hasher = iscc_core.code_data.DataHasherV0()
+        view = memoryview(static_bytes)
+        while view:
+            size = random.choice((1, 7, 255, 1024, 8191, 8192, 8193, 65536))
+            hasher.push(view[:size])
+            view = view[size:]
+        assert hasher.digest() == expected
+
+
+def test_DataHasherV0_push_tail_bounded(static_bytes):
+    hasher = iscc_core.code_data.DataHasherV0()
+    for i in range(0, len(static_bytes), 100000):
+        hasher.push(static_bytes[i : i + 100000])
+        assert len(hasher.tail) <= 8192
+    assert (
+        hasher.digest().hex() == "e5b3daf1118cf09cb5c5ac323a9f68ca04465f9e3942297ebd1e6360f5bb98df"
+    )
+
+
+def test_DataHasherV0_non_byte_buffer():
+    data = array("H", range(30000))
+    expected = iscc_core.code_data.DataHasherV0(BytesIO(data.tobytes()).read()).digest()
+    assert iscc_core.code_data.DataHasherV0(data).digest() == expected
+    hasher = iscc_core.code_data.DataHasherV0()
+    hasher.push(data[:10000])
+    hasher.push(memoryview(data[10000:]))
+    assert hasher.digest() == expected
+
+
+def test_gen_data_code_file(static_bytes, tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(static_bytes)
+    assert iscc_core.gen_data_code_file(path) == dict(iscc="ISCC:GAA6LM626EIYZ4E4")
+
+
+def test_gen_data_code_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert iscc_core.gen_data_code_file(str(path)) == iscc_core.gen_data_code_v0(BytesIO(b""))
+
+
+def test_DataHasherV0_granular(static_bytes):
+    hasher = iscc_core.code_data.DataHasherV0(static_bytes, granular=True)
+    digest = hasher.digest()
+    assert len(hasher.chunk_features) == len(hasher.chunk_sizes) == 1018
+    assert sum(hasher.chunk_sizes) == len(static_bytes)
+    assert digest == iscc_core.alg_minhash_256(list(hasher.chunk_features))
+
+
+def test_DataHasherV0_granular_empty():
+    hasher = iscc_core.code_data.DataHasherV0(granular=True)
+    assert (
+        hasher.digest().hex() == "25f0bab671f506e1c532f892d9d7917a252e7a520832f5963a8cd4e9a7e312b5"
+    )
+    assert hasher.chunk_sizes.tolist() == [0]
+
+
+def test_DataHasherV0_constant_memory(static_bytes, monkeypatch):
+    monkeypatch.setattr(iscc_core, "MINHASH_BLOCK_SIZE", 100)
+    hasher = iscc_core.code_data.DataHasherV0()
+    for i in range(0, len(static_bytes), 65536):
+        hasher.push(static_bytes[i : i + 65536])
+        assert len(hasher.pending) < 100
+    assert len(hasher.chunk_features) == 0
+    assert (
+        hasher.digest().hex() == "e5b3daf1118cf09cb5c5ac323a9f68ca04465f9e3942297ebd1e6360f5bb98df"
+    )
+    assert hasher.digest() == hasher.digest()
+
+
+def test_DataHasherV0_chunks(static_bytes):
+    hasher = iscc_core.code_data.DataHasherV0(granular=True)
+    for i in range(0, len(static_bytes), 10000):
+        hasher.push(static_bytes[i : i + 10000])
+    chunks = hasher.chunks()
+    assert set(chunks) == {"offsets", "sizes", "features"}
+    assert chunks["offsets"].typecode == "Q"
+    assert chunks["sizes"].typecode == chunks["features"].typecode == "I"
+    assert len(chunks["offsets"]) == 1018
+    expected = list(iscc_core.alg_cdc_chunks(static_bytes, False))
+    for (offset, size, feature), chunk in zip(hasher.iter_chunks(), expected):
+        assert static_bytes[offset : offset + size] == chunk
+        assert feature == xxhash.xxh32_intdigest(chunk)
+
+
+def test_DataHasherV0_chunks_copy():
+    hasher = iscc_core.code_data.DataHasherV0(b"data", granular=True)
+    chunks = hasher.chunks()
+    chunks["offsets"].append(99)
+    chunks["sizes"][0] = 0
+    chunks["features"].pop()
+    assert list(hasher.iter_chunks()) == [(0, 4, xxhash.xxh32_intdigest(b"data"))]
+
+
+def test_DataHasherV0_chunks_strong(static_bytes):
+    hasher = iscc_core.code_data.DataHasherV0(static_bytes, strong=True)
+    assert hasher.granular
+    chunks = hasher.chunks()
+    assert len(chunks["hashes"]) == 32 * len(chunks["sizes"])
+    offset, size, feature, strong = list(hasher.iter_chunks())[-1]
+    assert offset + size == len(static_bytes)
+    assert strong == blake3(static_bytes[offset:]).digest()
+    assert (
+        hasher.digest().hex() == "e5b3daf1118cf09cb5c5ac323a9f68ca04465f9e3942297ebd1e6360f5bb98df"
+    )
+
+
+def test_DataHasherV0_chunks_empty():
+    hasher = iscc_core.code_data.DataHasherV0(strong=True)
+    assert list(hasher.iter_chunks()) == [(0, 0, 46947589, blake3(b"").digest())]
+
+
+def test_DataHasherV0_chunks_not_granular():
+    with pytest.raises(ValueError):
+        iscc_core.code_data.DataHasherV0(b"data").chunks()
+
+
+def test_DataHasherV0_snapshot_restore(static_bytes, monkeypatch):
+    monkeypatch.setattr(iscc_core, "MINHASH_BLOCK_SIZE", 100)
+    hasher = iscc_core.code_data.DataHasherV0()
+    for i in range(0, len(static_bytes), 100003):
+        hasher = iscc_core.code_data.DataHasherV0.restore(hasher.snapshot())
+        hasher.push(static_bytes[i : i + 100003])
+    blob = hasher.snapshot()
+    assert len(blob) <= iscc_core.code_data.SNAPSHOT_HEADER.size + 8192 + 64 * 4
+    assert hasher.digest() == iscc_core.code_data.DataHasherV0.restore(blob).digest()
+    assert (
+        hasher.digest().hex() == "e5b3daf1118cf09cb5c5ac323a9f68ca04465f9e3942297ebd1e6360f5bb98df"
+    )
+
+
+def test_DataHasherV0_snapshot_restore_granular(static_bytes):
+    reference = iscc_core.code_data.DataHasherV0(static_bytes, strong=True)
+    hasher = iscc_core.code_data.DataHasherV0(static_bytes[:500000], strong=True)
+    hasher = iscc_core.code_data.DataHasherV0.restore(hasher.snapshot())
+    hasher.push(static_bytes[500000:])
+    assert hasher.chunks() == reference.chunks()
+    assert hasher.digest() == reference.digest()
+
+
+def test_DataHasherV0_snapshot_restore_empty():
+    hasher = iscc_core.code_data.DataHasherV0.restore(iscc_core.code_data.DataHasherV0().snapshot())
+    assert hasher.digest() == iscc_core.code_data.DataHasherV0().digest()
+
+
+def test_DataHasherV0_snapshot_restore_finalized(static_bytes):
+    hasher = iscc_core.code_data.DataHasherV0(static_bytes, granular=True)
+    digest = hasher.digest()
+    restored = iscc_core.code_data.DataHasherV0.restore(hasher.snapshot())
+    assert restored.tail is None
+    assert restored.digest() == digest
+    assert restored.chunks() == hasher.chunks()
+
+
+def test_DataHasherV0_restore_invalid(monkeypatch):
+    blob = iscc_core.code_data.DataHasherV0(b"data").snapshot()
+    with pytest.raises(ValueError):
+        iscc_core.code_data.DataHasherV0.restore(b"XXXX" + blob[4:])
+    with pytest.raises(ValueError):
+        iscc_core.code_data.DataHasherV0.restore(blob[:-1])
+    monkeypatch.setattr(iscc_core.core_opts, "data_avg_chunk_size", 2048)
+    with pytest.raises(ValueError):
+        iscc_core.code_data.DataHasherV0.restore(blob)
+
+
+def test_agen_data_code(static_bytes):
+    result = asyncio.run(iscc_core.agen_data_code(async_pieces(static_bytes, 50000)))
+    assert result == dict(iscc="ISCC:GAA6LM626EIYZ4E4")
+
+
+def test_agen_data_code_executor(static_bytes):
+    with ThreadPoolExecutor(2) as executor:
+        result = asyncio.run(
+            iscc_core.agen_data_code(async_pieces(static_bytes, 50000), 256, executor)
+        )
+    assert result == iscc_core.gen_data_code_v0(BytesIO(static_bytes), 256)
+
+
+def test_agen_data_code_empty():
+    result = asyncio.run(iscc_core.agen_data_code(async_pieces(b"", 1)))
+    assert result == iscc_core.gen_data_code_v0(BytesIO(b""))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from io import BytesIO
+import iscc_core as ic
+from .conftest import async_pieces
+
+
+def test_gen_data_instance_codes(static_bytes):
+    result = ic.gen_data_instance_codes(BytesIO(static_bytes))
+    instance = ic.gen_instance_code_v0(BytesIO(static_bytes))
+    assert result == dict(
+        units=["ISCC:GAA6LM626EIYZ4E4", instance["iscc"]],
+        datahash=instance["datahash"],
+        filesize=len(static_bytes),
+    )
+
+
+def test_gen_data_instance_codes_empty():
+    result = ic.gen_data_instance_codes(BytesIO(b""))
+    assert result == dict(
+        units=[
+            ic.gen_data_code_v0(BytesIO(b""))["iscc"],
+            "ISCC:IAA26E2JXH27TING",
+        ],
+        datahash="1e20af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262",
+        filesize=0,
+    )
+
+
+def test_gen_data_instance_codes_128():
+    result = ic.gen_data_instance_codes(BytesIO(b"hello world"), bits=128)
+    assert result["units"] == [
+        ic.gen_data_code_v0(BytesIO(b"hello world"), bits=128)["iscc"],
+        "ISCC:IAB5OSMB56TQUDEIBOGYYGMF2B25W",
+    ]
+
+
+def test_gen_data_instance_codes_file(static_bytes, tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(static_bytes)
+    assert ic.gen_data_instance_codes_file(path) == ic.gen_data_instance_codes(
+        BytesIO(static_bytes)
+    )
+
+
+def test_gen_iscc_code_from_units(static_bytes):
+    result = ic.gen_data_instance_codes(BytesIO(static_bytes))
+    assert ic.gen_iscc_code(result["units"])["iscc"].startswith("ISCC:")
+
+
+def test_DataInstanceHasher(static_bytes):
+    hasher = ic.DataInstanceHasher(static_bytes[:1000])
+    hasher.push(static_bytes[1000:])
+    assert hasher.data_hasher.digest() == ic.DataHasherV0(static_bytes).digest()
+    assert hasher.instance_hasher.digest() == ic.InstanceHasherV0(static_bytes).digest()
+    assert hasher.units() == hasher.units()
+
+
+def test_agen_data_instance_codes(static_bytes):
+    result = asyncio.run(ic.agen_data_instance_codes(async_pieces(static_bytes, 12345)))
+    assert result == ic.gen_data_instance_codes(BytesIO(static_bytes))
@@ -1,3 +1,4 @@
+import asyncio
 from io import BytesIO
 import iscc_core
 
@@ -55,3 +56,38 @@ def test_gen_instance_code_schema_conformance():
         "datahash": "1e20d74981efa70a0c880b8d8c1985d075dbcbf679b99a5f9914e5aaf96b831a9e24",
         "filesize": 11,
     }
+
+
+def test_gen_instance_code_file(tmp_path):
+    path = tmp_path / "hello.txt"
+    path.write_bytes(b"hello world")
+    assert iscc_core.gen_instance_code_file(path) == {
+        "iscc": "ISCC:IAA5OSMB56TQUDEI",
+        "datahash": "1e20d74981efa70a0c880b8d8c1985d075dbcbf679b99a5f9914e5aaf96b831a9e24",
+        "filesize": 11,
+    }
+
+
+def test_gen_instance_code_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert iscc_core.gen_instance_code_file(str(path)) == iscc_core.gen_instance_code_v0(
+        BytesIO(b"")
+    )
+
+
+async def read_stream(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await iscc_core.agen_instance_code(reader)
+
+
+def test_agen_instance_code(static_bytes):
+    result = asyncio.run(read_stream(static_bytes))
+    assert result == iscc_core.gen_instance_code_v0(BytesIO(static_bytes))
+
+
+def test_agen_instance_code_empty():
+    result = asyncio.run(read_stream(b""))
+    assert result == iscc_core.gen_instance_code_v0(BytesIO(b""))
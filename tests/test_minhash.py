@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import random
 import pytest
 import iscc_core as ic
 
@@ -37,3 +38,62 @@ def test_minhash_compress():
 def test_minhash_64():
     mh = ic.alg_minhash_64([2**16])
     assert mh.hex() == "a18e2fb2bd663d21"
+
+
+def test_minhash_np_matches_reference():
+    # Expected values calculated with the pure Python reference implementation
+    pytest.importorskip("numpy")
+    random.seed(5)
+    expected = {
+        1: "9fa9720b0ae6f8e1e9db8f5372c4a4a4",
+        2: "e7cace97140671774802ab30c4513877",
+        63: "364cd70bee14082f0425cbd562eade30",
+        4097: "1b8c237bfe3e9671f6157f40ca8cebac",
+        12288: "c3134b5b778829ef452f50fb3bb2bb98",
+    }
+    for n, prefix in expected.items():
+        features = [random.getrandbits(32) for _ in range(n)]
+        mh = ic.alg_minhash_np(features)
+        assert ic.alg_minhash_compress(mh, 32)[:16].hex() == prefix
+    mh = ic.alg_minhash_np([0, 2**64 - 1, 2**63, 1])
+    assert ic.alg_minhash_compress(mh, 32)[:16].hex() == "6f8c7309d00ea502ca3918804cace95d"
+
+
+def test_minhash_np_empty():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        ic.alg_minhash_np([])
+
+
+def test_minhash_large_int_fallback(monkeypatch):
+    features = [2**64, 2**70 + 5, 7, -1]
+    monkeypatch.setattr(ic.minhash, "np", None)
+    try:
+        expected = ic.alg_minhash(features)
+    except OverflowError:  # pragma: no cover
+        pytest.skip("Compiled minhash only supports uint64 features")
+    monkeypatch.undo()
+    assert ic.alg_minhash(features) == expected
+    assert ic.alg_minhash_64([-1]) == ic.alg_minhash_compress(ic.alg_minhash([-1]), 1)
+
+
+def test_minhash_update():
+    random.seed(6)
+    a = [random.getrandbits(32) for _ in range(100)]
+    b = [random.getrandbits(32) for _ in range(50)]
+    mh = ic.alg_minhash_update(None, a)
+    assert mh == ic.alg_minhash(a)
+    assert ic.alg_minhash_update(mh, b) == ic.alg_minhash(a + b)
+
+
+def test_minhash_compress_lsb():
+    mh = ic.alg_minhash([2**16])
+    bits = "".join(str(h >> bitpos & 1) for bitpos in range(3) for h in mh)
+    assert ic.alg_minhash_compress(mh, 3) == int(bits, 2).to_bytes(24, "big")
+    assert ic.alg_minhash_compress(mh, 32)[:4] == b"\xa1\x8e\x2f\xb2"
+
+
+def test_minhash_compress_unaligned():
+    # Bits are right aligned if they do not fill whole bytes
+    assert ic.alg_minhash_compress([1, 0, 1], 1) == b"\x05"
+    assert ic.alg_minhash_compress([0b11] * 5, 2) == b"\x03\xff"
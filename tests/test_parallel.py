@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+import os
+from io import BytesIO
+import pytest
+import iscc_core as ic
+
+
+@pytest.fixture(scope="module")
+def files(tmp_path_factory):
+    root = tmp_path_factory.mktemp("batch")
+    paths = []
+    for i, size in enumerate((0, 1, 1000, 100000, 300000)):
+        path = root / f"file{i}.bin"
+        path.write_bytes(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+def test_gen_codes_batch(files):
+    results = list(ic.gen_codes_batch(files, workers=2))
+    assert [r["path"] for r in results] == [str(p) for p in files]
+    for path, result in zip(files, results):
+        expected = ic.gen_data_instance_codes(BytesIO(path.read_bytes()))
+        assert result == dict(path=str(path), **expected)
+
+
+def test_gen_codes_batch_error(files):
+    paths = [files[2], files[0].parent / "missing.bin", files[3]]
+    results = list(ic.gen_codes_batch(paths, workers=2))
+    assert "units" in results[0]
+    assert results[1]["path"] == str(paths[1])
+    assert results[1]["error"].startswith("FileNotFoundError")
+    assert "units" in results[2]
+
+
+def test_gen_codes_batch_data_only(files):
+    results = list(ic.gen_codes_batch(files[2:4], units=("data",), workers=1))
+    assert results == [
+        dict(path=str(p), units=[ic.gen_data_code_file(p)["iscc"]]) for p in files[2:4]
+    ]
+
+
+def test_gen_codes_batch_instance_only(files):
+    results = list(ic.gen_codes_batch(files[1:3], units=["instance"], workers=1))
+    for path, result in zip(files[1:3], results):
+        expected = ic.gen_instance_code_file(path)
+        assert result == dict(
+            path=str(path),
+            units=[expected["iscc"]],
+            datahash=expected["datahash"],
+            filesize=expected["filesize"],
+        )
+
+
+def test_gen_codes_batch_unit_order(files):
+    a = list(ic.gen_codes_batch(files[2:3], units=("instance", "data"), workers=1))
+    b = list(ic.gen_codes_batch(files[2:3], workers=1))
+    assert a == b
+
+
+def test_gen_codes_batch_invalid_units():
+    with pytest.raises(ValueError):
+        list(ic.gen_codes_batch([], units=("meta",)))
+    with pytest.raises(ValueError):
+        list(ic.gen_codes_batch([], units=()))
+
+
+def test_gen_codes_file(files):
+    path = files[3]
+    result = ic.parallel.gen_codes_file(path)
+    assert result == dict(path=str(path), **ic.gen_data_instance_codes_file(path))
+
+
+def test_gen_codes_file_data_only(files):
+    path = files[3]
+    result = ic.parallel.gen_codes_file(path, ("data",))
+    assert result == dict(path=str(path), units=[ic.gen_data_code_file(path)["iscc"]])
+
+
+def test_gen_codes_file_instance_only(files):
+    path = files[2]
+    expected = ic.gen_instance_code_file(path)
+    result = ic.parallel.gen_codes_file(path, ("instance",))
+    assert result == dict(
+        path=str(path),
+        units=[expected["iscc"]],
+        datahash=expected["datahash"],
+        filesize=expected["filesize"],
+    )
+
+
+def test_gen_codes_file_error(files):
+    path = files[0].parent / "missing.bin"
+    result = ic.parallel.gen_codes_file(path)
+    assert result["path"] == str(path)
+    assert result["error"].startswith("FileNotFoundError")
+    assert "units" not in result
+
+
+def test_imap_ordered_window():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(2) as executor:
+        results = ic.parallel.imap_ordered(executor, pow, ((i, 2) for i in range(10)), 3)
+        assert list(results) == [i**2 for i in range(10)]
+
+
+def test_soft_hash_data_parallel(static_bytes, tmp_path):
+    path = tmp_path / "static.bin"
+    path.write_bytes(static_bytes)
+    digest = ic.soft_hash_data_parallel(path, workers=2, segment_size=100001)
+    assert digest.hex() == "e5b3daf1118cf09cb5c5ac323a9f68ca04465f9e3942297ebd1e6360f5bb98df"
+
+
+def test_soft_hash_data_parallel_no_resync(tmp_path):
+    # Runs of identical bytes never resynchronize and are re-chunked sequentially
+    data = b"\x00" * 100000 + os.urandom(60000) + b"\x00" * 30000
+    path = tmp_path / "zeros.bin"
+    path.write_bytes(data)
+    for segment_size in (5000, 30001):
+        digest = ic.soft_hash_data_parallel(path, workers=2, segment_size=segment_size)
+        assert digest == ic.DataHasherV0(data).digest()
+
+
+@pytest.mark.parametrize("start,end", [(0, 200000), (123457, 600000)])
+def test_hash_data_segment(static_bytes, tmp_path, monkeypatch, start, end):
+    monkeypatch.setattr(ic, "MINHASH_BLOCK_SIZE", 64)
+    path = tmp_path / "static.bin"
+    path.write_bytes(static_bytes)
+    chunks = ic.DataHasherV0(static_bytes[start:], granular=True).chunks()
+    spans = [
+        (start + offset, size, feature)
+        for offset, size, feature in zip(chunks["offsets"], chunks["sizes"], chunks["features"])
+        if start + offset < end
+    ]
+    head, body, end_cut = ic.parallel.hash_data_segment(path, start, end)
+    n = ic.parallel.SEGMENT_SYNC_CHUNKS
+    assert head == [(offset, feature) for offset, _, feature in spans[:n]]
+    assert body == ic.alg_minhash([feature for _, _, feature in spans[n:]])
+    assert end_cut == spans[-1][0] + spans[-1][1]
+
+
+def test_hash_data_segment_head_only(static_bytes, tmp_path):
+    path = tmp_path / "static.bin"
+    path.write_bytes(static_bytes)
+    head, body, end_cut = ic.parallel.hash_data_segment(path, 0, 10000)
+    assert 0 < len(head) < ic.parallel.SEGMENT_SYNC_CHUNKS
+    assert body is None
+    assert end_cut >= 10000
+
+
+def test_gen_data_code_parallel(files):
+    for path in files:
+        assert ic.gen_data_code_parallel(path, workers=2) == ic.gen_data_code_file(path)
+
+
+def test_gen_text_codes(tmp_path):
+    texts = [f"Hello World {i} " * i for i in range(7)]
+    path = tmp_path / "text.txt"
+    path.write_text(texts[3], encoding="utf-8")
+    inputs = texts + [path, tmp_path / "missing.txt"]
+    results = list(ic.gen_text_codes(inputs, workers=2, chunksize=2))
+    assert results[:7] == [ic.gen_text_code_v0(text) for text in texts]
+    assert results[7] == dict(path=str(path), **ic.gen_text_code_v0(texts[3]))
+    assert results[8]["path"] == str(tmp_path / "missing.txt")
+    assert results[8]["error"].startswith("FileNotFoundError")
+
+
+def test_gen_text_code_batch_path(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("Hello World", encoding="utf-8")
+    results = ic.parallel.gen_text_code_batch([path, "Hello World"], bits=128)
+    expected = ic.gen_text_code_v0("Hello World", 128)
+    assert results == [dict(path=str(path), **expected), expected]
+
+
+def test_gen_text_code_batch_error():
+    result = ic.parallel.gen_text_code_batch([b"bytes"])[0]
+    assert result["error"].startswith("TypeError")
+
+
+def test_batched():
+    assert list(ic.parallel.batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(ic.parallel.batched([], 2)) == []
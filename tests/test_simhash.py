@@ -1,4 +1,9 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import math
+import random
+from bitarray import bitarray
+import pytest
 import iscc_core.simhash
 
 
@@ -41,3 +46,66 @@ def test_similarity_hash_256_bit():
         iscc_core.simhash.alg_simhash([a, b]).hex()
         == "dcfeffcbbffbff66f79dfcdfffafbffbfeff66f7defabdff7f3bbff6bf93fb5d"
     )
+
+
+def test_similarity_hash_many_digests():
+    digests = [hashlib.sha256(str(i).encode()).digest() for i in range(1001)]
+    assert (
+        iscc_core.simhash.alg_simhash(digests).hex()
+        == "12c88a7ba1ce0483c3fd7b082b53b510a7cc6fe3863a116e3f0850785fffff59"
+    )
+
+
+def test_similarity_hash_unequal_sizes():
+    with pytest.raises(ValueError):
+        iscc_core.simhash.alg_simhash([b"\x00\x00", b"\x00"])
+
+
+def test_similarity_hash_weighted_equal_weights():
+    digests = [hashlib.sha256(str(i).encode()).digest() for i in range(101)]
+    expected = iscc_core.simhash.alg_simhash(digests)
+    assert iscc_core.simhash.alg_simhash_weighted(digests, [1] * 101) == expected
+    assert iscc_core.simhash.alg_simhash_weighted(digests, [0.5] * 101) == expected
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_similarity_hash_weighted_ties(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(iscc_core.simhash, "np", None)
+    for n, weight in ((6, 0.3), (10, 0.7), (10, 1 / 3), (20, 0.1), (30, 0.1)):
+        digests = [b"\xff"] * (n // 2) + [b"\x00"] * (n // 2)
+        expected = iscc_core.simhash.alg_simhash(digests)
+        assert iscc_core.simhash.alg_simhash_weighted(digests, [weight] * n) == expected
+    assert iscc_core.simhash.alg_simhash_weighted([b"\xf0", b"\x0f"], [0.3, 0.1 + 0.2]) == b"\x0f"
+    assert iscc_core.simhash.alg_simhash_weighted([b"\xf0", b"\x0f"], [0, 0]) == b"\xff"
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_similarity_hash_weighted_random(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(iscc_core.simhash, "np", None)
+    rnd = random.Random(3)
+    digests = [rnd.randbytes(8) for _ in range(5000)]
+    weights = [rnd.random() for _ in digests]
+    expected = bitarray(64)
+    for i in range(64):
+        on = math.fsum(w for d, w in zip(digests, weights) if d[i // 8] >> (7 - i % 8) & 1)
+        expected[i] = on >= math.fsum(weights) - on
+    assert iscc_core.simhash.alg_simhash_weighted(digests, weights) == expected.tobytes()
+
+
+def test_similarity_hash_weighted():
+    a = bytes.fromhex("f0")
+    b = bytes.fromhex("0f")
+    c = bytes.fromhex("ff")
+    assert iscc_core.simhash.alg_simhash_weighted([a, b], [3, 1]).hex() == "f0"
+    assert iscc_core.simhash.alg_simhash_weighted([a, b], [1, 3]).hex() == "0f"
+    assert iscc_core.simhash.alg_simhash_weighted([a, b, c], [2, 2, 0.5]).hex() == "ff"
+    assert iscc_core.simhash.alg_simhash_weighted([a, b, c], [2, 3, 0]).hex() == "0f"
+
+
+def test_similarity_hash_weighted_invalid():
+    with pytest.raises(ValueError):
+        iscc_core.simhash.alg_simhash_weighted([b"\x00", b"\x00"], [1])
+    with pytest.raises(ValueError):
+        iscc_core.simhash.alg_simhash_weighted([b"\x00\x00", b"\x00"], [1, 1])
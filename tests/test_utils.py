@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import io
 import os
 import random
 
 import pytest
 import iscc_core as ic
+from .conftest import async_pieces
 
 A_INT = 0b00000000_00001111_00000000_00000000_00000000_00000000_00000000_00000000
 B_INT = 0b11110000_00001111_00000000_00000000_00000000_00000000_00000000_00000000
@@ -420,3 +422,68 @@ def test_iscc_nph_similarity_empty():
     result = ic.utils.iscc_nph_similarity(a, b)
     assert result["similarity"] == 0.0
     assert result["common_prefix_bits"] == 0
+
+
+def test_mmap_views(tmp_path):
+    data = os.urandom(10000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    views = [bytes(v) for v in ic.mmap_views(path, size=4096)]
+    assert [len(v) for v in views] == [4096, 4096, 1808]
+    assert b"".join(views) == data
+
+
+def test_mmap_views_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert list(ic.mmap_views(path)) == []
+
+
+def test_mmap_views_early_exit(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x00" * 10000)
+    for view in ic.mmap_views(str(path), size=1000):
+        assert len(view) == 1000
+        break
+
+
+async def collect(source, size):
+    return [data async for data in ic.aiter_data(source, size)]
+
+
+async def collect_reader(data, size):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await collect(reader, size)
+
+
+def test_aiter_data_reader():
+    assert asyncio.run(collect_reader(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+    assert asyncio.run(collect_reader(b"", 3)) == []
+
+
+async def sparse_source():
+    yield b"ab"
+    yield b""
+    yield b"cde"
+
+
+def test_aiter_data_iterable():
+    assert asyncio.run(collect(async_pieces(b"abcde", 2), 1)) == [b"ab", b"cd", b"e"]
+    assert asyncio.run(collect(sparse_source(), 1)) == [b"ab", b"cde"]
+
+
+def test_pack_bits():
+    assert ic.utils.pack_bits([]) == b""
+    assert ic.utils.pack_bits([1, 0, 0, 0, 0, 0, 0, 1]) == b"\x81"
+    assert ic.utils.pack_bits([True, False, True]) == b"\x05"
+
+
+def test_pack_bits_matches_bitstring():
+    rnd = random.Random(7)
+    for size in (1, 7, 8, 63, 64, 255, 256):
+        bits = [rnd.getrandbits(1) for _ in range(size)]
+        bitstring = "".join(str(b) for b in bits)
+        expected = int(bitstring, 2).to_bytes((size + 7) // 8, "big")
+        assert ic.utils.pack_bits(bits) == expected
@@ -28,3 +28,16 @@ def test_wtahash():
         ic.alg_wtahash(vec, 256).hex()
         == "528f91431f7c4ad26932fc073a28cac93f21a3071a152fc2925bdaed1d190061"
     )
+
+
+def test_wtahash_ties_and_bits():
+    vec = [1.5] * 380
+    assert ic.alg_wtahash(vec, 64) == bytes(8)
+    vec = tuple(reversed(range(380)))
+    assert ic.alg_wtahash(vec, 64).hex() == "ad706ebce083b52d"
+
+
+def test_wtahash_bits_not_multiple_of_8():
+    vec = tuple(reversed(range(380)))
+    assert ic.alg_wtahash(vec, 12).hex() == "ad70"
+    assert ic.alg_wtahash([0] * 379 + [1], 4) == b"\x00"